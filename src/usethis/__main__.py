@@ -1,33 +1,58 @@
+import importlib
 import sys
+from typing import TYPE_CHECKING, ClassVar
 
 import typer
+import typer.core
+import typer.main
 
-import usethis._interface.badge
-import usethis._interface.browse
-import usethis._interface.ci
-import usethis._interface.show
-import usethis._interface.tool
 from usethis._config import quiet_opt, usethis_config
-from usethis._core.badge import add_pre_commit_badge, add_ruff_badge
-from usethis._core.readme import add_readme
-from usethis._tool import PreCommitTool, RuffTool
+
+if TYPE_CHECKING:
+    import click
 
 try:
     from usethis._version import __version__
 except ImportError:
     __version__ = None
 
+
+class _LazyGroup(typer.core.TyperGroup):
+    """A command group which only imports a subcommand's module when it's needed.
+
+    Each lazy subcommand maps to a module with a Typer `app` attribute.
+    """
+
+    lazy_subcommands: ClassVar[dict[str, str]] = {
+        "badge": "usethis._interface.badge",
+        "browse": "usethis._interface.browse",
+        "ci": "usethis._interface.ci",
+        "show": "usethis._interface.show",
+        "tool": "usethis._interface.tool",
+    }
+
+    def list_commands(self, ctx: "click.Context") -> list[str]:
+        return [*super().list_commands(ctx), *self.lazy_subcommands]
+
+    def get_command(
+        self, ctx: "click.Context", cmd_name: str
+    ) -> "click.Command | None":
+        if cmd_name in self.lazy_subcommands:
+            module = importlib.import_module(self.lazy_subcommands[cmd_name])
+            # Mirror app.add_typer so the subcommand is always a named group.
+            wrapper = typer.Typer()
+            wrapper.add_typer(module.app, name=cmd_name)
+            return typer.main.get_group(wrapper).commands[cmd_name]
+        return super().get_command(ctx, cmd_name)
+
+
 app = typer.Typer(
+    cls=_LazyGroup,
     help=(
         "Automate Python package and project setup tasks that are otherwise "
         "performed manually."
-    )
+    ),
 )
-app.add_typer(usethis._interface.badge.app, name="badge")
-app.add_typer(usethis._interface.browse.app, name="browse")
-app.add_typer(usethis._interface.ci.app, name="ci")
-app.add_typer(usethis._interface.show.app, name="show")
-app.add_typer(usethis._interface.tool.app, name="tool")
 
 
 @app.command(help="Add a README.md file to the project.")
@@ -35,6 +60,10 @@ def readme(
     quiet: bool = quiet_opt,
     badges: bool = typer.Option(False, "--badges", help="Add relevant badges"),
 ) -> None:
+    from usethis._core.badge import add_pre_commit_badge, add_ruff_badge
+    from usethis._core.readme import add_readme
+    from usethis._tool import PreCommitTool, RuffTool
+
     with usethis_config.set(quiet=quiet):
         add_readme()
 
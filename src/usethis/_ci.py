@@ -1,29 +1,35 @@
-import re
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from usethis._integrations.bitbucket.anchor import ScriptItemAnchor
-from usethis._integrations.bitbucket.schema import Script, Step
-from usethis._integrations.bitbucket.steps import (
-    add_step_in_default,
-    get_steps_in_default,
-    remove_step_from_default,
-)
 from usethis._integrations.uv.python import get_supported_major_python_versions
 
+if TYPE_CHECKING:
+    from usethis._integrations.bitbucket.schema import Step
+
+# The Bitbucket integration is imported within each function, since building its
+# schema models is slow and most commands never touch 'bitbucket-pipelines.yml'.
+
 
 def is_bitbucket_used() -> bool:
     return (Path.cwd() / "bitbucket-pipelines.yml").exists()
 
 
 def add_bitbucket_pre_commit_step() -> None:
+    from usethis._integrations.bitbucket.steps import add_step_in_default
+
     add_step_in_default(_get_bitbucket_pre_commit_step())
 
 
 def remove_bitbucket_pre_commit_step() -> None:
+    from usethis._integrations.bitbucket.steps import remove_step_from_default
+
     remove_step_from_default(_get_bitbucket_pre_commit_step())
 
 
-def _get_bitbucket_pre_commit_step() -> Step:
+def _get_bitbucket_pre_commit_step() -> "Step":
+    from usethis._integrations.bitbucket.anchor import ScriptItemAnchor
+    from usethis._integrations.bitbucket.schema import Script, Step
+
     return Step(
         name="Run pre-commit",
         caches=["uv", "pre-commit"],
@@ -37,6 +43,15 @@ def _get_bitbucket_pre_commit_step() -> Step:
 
 
 def update_bitbucket_pytest_steps() -> None:
+    from usethis._integrations.bitbucket.anchor import ScriptItemAnchor
+    from usethis._integrations.bitbucket.schema import Script, Step
+    from usethis._integrations.bitbucket.steps import (
+        TEST_STEP_NAME_REGEX,
+        add_step_in_default,
+        get_steps_in_default,
+        remove_step_from_default,
+    )
+
     matrix = get_supported_major_python_versions()
     for version in matrix:
         add_step_in_default(
@@ -54,7 +69,7 @@ def update_bitbucket_pytest_steps() -> None:
     # We also need to remove any old steps that are not in the matrix
     for step in get_steps_in_default():
         if step.name is not None:
-            match = re.match(r"^Test on 3\.(\d+)$", step.name)
+            match = TEST_STEP_NAME_REGEX.match(step.name)
             if match:
                 version = int(match.group(1))
                 if version not in matrix:
@@ -62,7 +77,13 @@ def update_bitbucket_pytest_steps() -> None:
 
 
 def remove_bitbucket_pytest_steps() -> None:
-    # Remove any with pattern "^Test on 3.\d+$"
+    from usethis._integrations.bitbucket.steps import (
+        TEST_STEP_NAME_REGEX,
+        get_steps_in_default,
+        remove_step_from_default,
+    )
+
+    # Remove any with pattern "^Test on 3\.\d+$"
     for step in get_steps_in_default():
-        if step.name is not None and re.match(r"^Test on 3.\d+$", step.name):
+        if step.name is not None and TEST_STEP_NAME_REGEX.match(step.name):
             remove_step_from_default(step)
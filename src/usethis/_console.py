@@ -1,33 +1,47 @@
-from rich.console import Console
+from functools import cache
+from typing import TYPE_CHECKING
 
 from usethis._config import usethis_config
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+@cache
+def _get_console() -> "Console":
+    # Importing rich is relatively slow, so defer it until something is printed.
+    from rich.console import Console
+
+    return Console()
 
 
 def tick_print(msg: str | Exception) -> None:
-    msg = str(msg)
+    if usethis_config.quiet:
+        return
 
-    if not usethis_config.quiet:
-        console.print(f"✔ {msg}", style="green")
+    msg = str(msg)
+    _get_console().print(f"✔ {msg}", style="green")
 
 
 def box_print(msg: str | Exception) -> None:
-    msg = str(msg)
+    if usethis_config.quiet:
+        return
 
-    if not usethis_config.quiet:
-        console.print(f"☐ {msg}", style="red")
+    msg = str(msg)
+    _get_console().print(f"☐ {msg}", style="red")
 
 
 def info_print(msg: str | Exception) -> None:
-    msg = str(msg)
+    if usethis_config.quiet:
+        return
 
-    if not usethis_config.quiet:
-        console.print(f"ℹ {msg}", style="blue")  # noqa: RUF001
+    msg = str(msg)
+    _get_console().print(f"ℹ {msg}", style="blue")  # noqa: RUF001
 
 
 def err_print(msg: str | Exception) -> None:
-    msg = str(msg)
+    if usethis_config.quiet:
+        return
 
-    if not usethis_config.quiet:
-        console.print(f"✗ {msg}", style="red")
+    msg = str(msg)
+    _get_console().print(f"✗ {msg}", style="red")
@@ -7,13 +7,16 @@ from usethis._integrations.bitbucket.config import (
     add_bitbucket_pipeline_config,
     remove_bitbucket_pipeline_config,
 )
+from usethis._integrations.pyproject.io import edit_pyproject_toml
 from usethis._tool import PreCommitTool, PytestTool
 
 
 def use_ci_bitbucket(*, remove: bool = False) -> None:
     if not remove:
-        use_pre_commit = PreCommitTool().is_used()
-        use_pytest = PytestTool().is_used()
+        # Share a single parse of 'pyproject.toml' between the checks.
+        with edit_pyproject_toml():
+            use_pre_commit = PreCommitTool().is_used()
+            use_pytest = PytestTool().is_used()
         use_any_tool = use_pre_commit or use_pytest
 
         add_bitbucket_pipeline_config(report_placeholder=not use_any_tool)
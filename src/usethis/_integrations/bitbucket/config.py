@@ -19,9 +19,11 @@ def add_bitbucket_pipeline_config(report_placeholder: bool = True) -> None:
 
 
 def remove_bitbucket_pipeline_config() -> None:
-    if not (Path.cwd() / "bitbucket-pipelines.yml").exists():
+    path = Path.cwd() / "bitbucket-pipelines.yml"
+
+    if not path.exists():
         # Early exit; the file already doesn't exist
         return
 
     tick_print("Removing 'bitbucket-pipelines.yml'.")
-    (Path.cwd() / "bitbucket-pipelines.yml").unlink()
+    path.unlink()
@@ -1,6 +1,7 @@
 from collections.abc import Generator
 from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 from pydantic import ValidationError
@@ -8,7 +9,7 @@ from ruamel.yaml.comments import CommentedMap
 
 from usethis._console import tick_print
 from usethis._integrations.bitbucket.schema import PipelinesConfiguration
-from usethis._integrations.yaml.io import YAMLLiteral, edit_yaml
+from usethis._integrations.yaml.io import YAMLLiteral, edit_yaml, parse_yaml
 
 
 class BitbucketPipelinesYAMLConfigError(Exception):
@@ -38,15 +39,33 @@ def edit_bitbucket_pipelines_yaml() -> (
 
     if not path.exists():
         tick_print(f"Writing '{name}'.")
-        path.write_text("image: atlassian/default-image:3")
+        path.write_text("image: atlassian/default-image:3\n")
         guess_indent = False
     else:
         guess_indent = _has_indentation(path)
 
     with edit_yaml(path, guess_indent=guess_indent) as doc:
         config = _validate_config(doc.content)
+        # The model can be modified within the context, so keep a JSON snapshot to
+        # check whether the edit changed anything. This is cheap compared to dumping.
+        original_json = config.model_dump_json()
         yield BitbucketPipelinesYAMLDocument(content=doc.content, model=config)
-        _validate_config(doc.content)
+        doc.write = _validate_config(doc.content).model_dump_json() != original_json
+
+
+def read_bitbucket_pipelines_yaml() -> PipelinesConfiguration:
+    """Read the configuration in 'bitbucket-pipelines.yml' without modifying it.
+
+    The configuration is cached on the contents of the file and shared between calls,
+    so it must not be modified. Use `edit_bitbucket_pipelines_yaml` to make changes.
+    """
+    path = Path.cwd() / "bitbucket-pipelines.yml"
+    return _parse_bitbucket_pipelines_yaml(path.read_text(), path=path)
+
+
+@lru_cache(maxsize=8)
+def _parse_bitbucket_pipelines_yaml(text: str, *, path: Path) -> PipelinesConfiguration:
+    return _validate_config(parse_yaml(text, yaml_path=path))
 
 
 def _validate_config(ruamel_content: YAMLLiteral) -> PipelinesConfiguration:
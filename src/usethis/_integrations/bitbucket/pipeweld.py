@@ -1,6 +1,5 @@
+from collections.abc import Iterator
 from functools import singledispatch
-from typing import assert_never
-from uuid import uuid4
 
 import usethis._pipeweld.containers
 from usethis._integrations.bitbucket.dump import bitbucket_fancy_dump
@@ -12,9 +11,7 @@ from usethis._integrations.bitbucket.io import (
 from usethis._integrations.bitbucket.schema import (
     ImportPipeline,
     Items,
-    ParallelExpanded,
     ParallelItem,
-    ParallelSteps,
     Pipeline,
     Pipelines,
     PipelinesConfiguration,
@@ -22,7 +19,10 @@ from usethis._integrations.bitbucket.schema import (
     Step,
     StepItem,
 )
-from usethis._integrations.bitbucket.schema_utils import step1tostep
+from usethis._integrations.bitbucket.schema_utils import (
+    get_parallel_step_items,
+    step1tostep,
+)
 from usethis._integrations.yaml.update import update_ruamel_yaml_map
 from usethis._pipeweld.ops import Instruction
 
@@ -52,13 +52,15 @@ def get_pipeweld_pipeline_from_default(
         items = default.root.root
 
     return usethis._pipeweld.containers.series(
-        *[get_pipeweld_object(item) for item in items]
+        *[get_pipeweld_object(item, idx=idx) for idx, item in enumerate(items)]
     )
 
 
 @singledispatch
 def get_pipeweld_object(
     item: StepItem | ParallelItem | StageItem,
+    *,
+    idx: int,
 ) -> (
     str | usethis._pipeweld.containers.Parallel | usethis._pipeweld.containers.DepGroup
 ):
@@ -66,49 +68,62 @@ def get_pipeweld_object(
 
 
 @get_pipeweld_object.register
-def _(item: StepItem):
+def _(item: StepItem, *, idx: int):
     return get_pipeweld_step(item.step)
 
 
 @get_pipeweld_object.register
-def _(item: ParallelItem):
-    parallel_steps: set[str] = set()
-
-    if item.parallel is not None:
-        if isinstance(item.parallel.root, ParallelSteps):
-            step_items = item.parallel.root.root
-        elif isinstance(item.parallel.root, ParallelExpanded):
-            step_items = item.parallel.root.steps.root
-        else:
-            assert_never(item.parallel.root)
-
-        for step_item in step_items:
-            parallel_steps.add(get_pipeweld_step(step_item.step))
-
-    return usethis._pipeweld.containers.Parallel(frozenset(parallel_steps))
+def _(item: ParallelItem, *, idx: int):
+    return usethis._pipeweld.containers.Parallel(frozenset(_iter_pipeweld_steps(item)))
 
 
 @get_pipeweld_object.register
-def _(item: StageItem):
-    depgroup_steps: list[str] = []
-
+def _(item: StageItem, *, idx: int):
     if item.stage.name is not None:
         name = item.stage.name
     else:
-        name = str(f"Unnamed Stage {uuid4()}")
-
-    for step in item.stage.steps:
-        depgroup_steps.append(get_pipeweld_step(step1tostep(step)))
+        # The position in the pipeline is enough to tell unnamed stages apart.
+        name = f"Unnamed Stage {idx}"
 
     return usethis._pipeweld.containers.DepGroup(
-        series=usethis._pipeweld.containers.series(*depgroup_steps),
+        series=usethis._pipeweld.containers.series(*_iter_pipeweld_steps(item)),
         config_group=name,
     )
 
 
+@singledispatch
+def _iter_pipeweld_steps(
+    item: StepItem | ParallelItem | StageItem,
+) -> Iterator[str]:
+    """Lazily iterate over the pipeweld names of the steps in an item."""
+    raise NotImplementedError
+
+
+@_iter_pipeweld_steps.register
+def _(item: StepItem) -> Iterator[str]:
+    yield get_pipeweld_step(item.step)
+
+
+@_iter_pipeweld_steps.register
+def _(item: ParallelItem) -> Iterator[str]:
+    for step_item in get_parallel_step_items(item.parallel.root):
+        yield get_pipeweld_step(step_item.step)
+
+
+@_iter_pipeweld_steps.register
+def _(item: StageItem) -> Iterator[str]:
+    for step1 in item.stage.steps:
+        yield get_pipeweld_step(step1tostep(step1))
+
+
 def apply_pipeweld_instruction(instruction: Instruction, *, new_step: Step) -> None:
     with edit_bitbucket_pipelines_yaml() as doc:
-        apply_pipeweld_instruction_via_doc(instruction, doc=doc, new_step=new_step)
+        is_changed = apply_pipeweld_instruction_via_doc(
+            instruction, doc=doc, new_step=new_step
+        )
+        if not is_changed:
+            return
+
         dump = bitbucket_fancy_dump(doc.model, reference=doc.content)
         update_ruamel_yaml_map(doc.content, dump, preserve_comments=True)
 
@@ -118,10 +133,15 @@ def apply_pipeweld_instruction_via_doc(
     *,
     new_step: Step,
     doc: BitbucketPipelinesYAMLDocument,
-) -> None:
+) -> bool:
+    """Apply a pipeweld instruction to the model of a document.
+
+    Returns:
+        Whether the model was changed, i.e. whether the new step was inserted.
+    """
     if get_pipeweld_step(new_step) != instruction.step:
         # N.B. This doesn't currently handle moving existing steps
-        return
+        return False
 
     if doc.model.pipelines is None:
         doc.model.pipelines = Pipelines()
@@ -140,60 +160,21 @@ def apply_pipeweld_instruction_via_doc(
     else:
         items = default.root.root
 
+    is_inserted = False
     if instruction.after is None:
         items.insert(0, StepItem(step=new_step))
+        is_inserted = True
     else:
-        for item in items:
-            if _is_insertion_necessary(item, instruction=instruction):
+        for idx, item in enumerate(items):
+            # N.B. the membership check stops at the first matching step
+            if instruction.after in _iter_pipeweld_steps(item):
                 # N.B. This doesn't currently handle InsertParallel properly
-                items.insert(
-                    items.index(item) + 1,
-                    StepItem(step=new_step),
-                )
+                items.insert(idx + 1, StepItem(step=new_step))
+                is_inserted = True
+                # Inserting invalidates the iteration, so stop here.
                 break
 
     if default is None and items:
         pipelines.default = Pipeline(Items(items))
 
-
-@singledispatch
-def _is_insertion_necessary(
-    item: StepItem | ParallelItem | StageItem,
-    *,
-    instruction: Instruction,
-) -> bool:
-    raise NotImplementedError
-
-
-@_is_insertion_necessary.register
-def _(item: StepItem, *, instruction: Instruction):
-    return get_pipeweld_step(item.step) == instruction.after
-
-
-@_is_insertion_necessary.register
-def _(item: ParallelItem, *, instruction: Instruction):
-    if item.parallel is not None:
-        if isinstance(item.parallel.root, ParallelSteps):
-            step_items = item.parallel.root.root
-        elif isinstance(item.parallel.root, ParallelExpanded):
-            step_items = item.parallel.root.steps.root
-        else:
-            assert_never(item.parallel.root)
-
-        for step_item in step_items:
-            if get_pipeweld_step(step_item.step) == instruction.after:
-                return True
-    return False
-
-
-@_is_insertion_necessary.register
-def _(item: StageItem, *, instruction: Instruction):
-    step1s = item.stage.steps.copy()
-
-    for step1 in step1s:
-        step = step1tostep(step1)
-
-        if get_pipeweld_step(step) == instruction.after:
-            return True
-
-    return False
+    return is_inserted
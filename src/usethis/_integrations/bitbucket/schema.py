@@ -11,27 +11,74 @@
 # plus manually forbid Step1.step from being None
 # plus manually forbid ParallelItem.parallel from being None
 # plus manually forbid StageItem.stage from being None
+# plus manually replace leaf RootModels (Depth, MaxTime, Size, Trigger, FailFast,
+#   ArtifactsPaths, RunsOnItem, RunsOnExpanded) with Annotated aliases
+# plus manually discriminate the list-or-mapping unions and pipeline items by shape,
+#   using _get_shape_tag and _get_item_tag
+# plus manually discriminate Script items using _get_script_item_tag
+# plus manually defer building validators until first use (defer_build=True), and
+#   don't parametrize RootModel bases, since that builds a validator eagerly
 
 from __future__ import annotations
 
-from typing import Any, Literal
+from typing import Annotated, Any, Literal
 
-from pydantic import BaseModel, ConfigDict, Field, RootModel
+from pydantic import BaseModel, ConfigDict, Discriminator, Field, RootModel, Tag
 
 from usethis._integrations.bitbucket.anchor import ScriptItemAnchor
 
 
-class Depth(RootModel[int]):
-    root: int = Field(
-        ...,
+def _get_shape_tag(value: Any) -> str | None:
+    if isinstance(value, RootModel):
+        value = value.root
+
+    if isinstance(value, str):
+        return "str"
+    if isinstance(value, list):
+        return "list"
+    if isinstance(value, dict | BaseModel):
+        return "dict"
+    return None
+
+
+def _get_script_item_tag(value: Any) -> str | None:
+    if isinstance(value, str):
+        return "str"
+    if isinstance(value, Pipe) or (isinstance(value, dict) and "pipe" in value):
+        return "pipe"
+    if isinstance(value, ScriptItemAnchor | dict):
+        return "anchor"
+    return None
+
+
+def _get_item_tag(value: Any) -> str | None:
+    if isinstance(value, dict):
+        for key in ("step", "parallel", "stage", "variables"):
+            if key in value:
+                return key
+        return None
+
+    return {
+        StepItem: "step",
+        ParallelItem: "parallel",
+        StageItem: "stage",
+        VariablesItem: "variables",
+    }.get(type(value))
+
+
+Depth = Annotated[
+    int,
+    Field(
         description='The depth argument of Git clone operation. It can be either number or "full" value',
         examples=["full"],
         ge=1,
         title="Git Clone Depth",
-    )
+    ),
+]
 
 
 class SparseCheckout(BaseModel):
+    model_config = ConfigDict(defer_build=True)
     cone_mode: bool | None = Field(
         default=True,
         alias="cone-mode",
@@ -45,6 +92,7 @@ class SparseCheckout(BaseModel):
 
 
 class Clone(BaseModel):
+    model_config = ConfigDict(defer_build=True)
     depth: Depth | Literal["full"] | None = Field(
         default=50,
         description='The depth argument of Git clone operation. It can be either number or "full" value',
@@ -82,24 +130,27 @@ class Clone(BaseModel):
     )
 
 
-class MaxTime(RootModel[int]):
-    root: int = Field(
-        ...,
+MaxTime = Annotated[
+    int,
+    Field(
         description="The maximum time a step can execute for in minutes.",
         examples=[60],
         gt=0,
-    )
+    ),
+]
 
 
-class Size(RootModel[Literal["1x", "2x", "4x", "8x", "16x", "32x"]]):
-    root: Literal["1x", "2x", "4x", "8x", "16x", "32x"] = Field(
-        ...,
+Size = Annotated[
+    Literal["1x", "2x", "4x", "8x", "16x", "32x"],
+    Field(
         description="The size of the step, sets the amount of resources allocated.",
         title="Step Size",
-    )
+    ),
+]
 
 
 class Key(BaseModel):
+    model_config = ConfigDict(defer_build=True)
     files: list[str] = Field(
         ...,
         description="Checksum of these file paths will be used to generate the cache key.",
@@ -107,7 +158,8 @@ class Key(BaseModel):
     )
 
 
-class CachePath(RootModel[str]):
+class CachePath(RootModel):
+    model_config = ConfigDict(defer_build=True)
     root: str = Field(
         ...,
         description="Path to the directory to be cached, can be absolute or relative to the clone directory.",
@@ -116,6 +168,7 @@ class CachePath(RootModel[str]):
 
 
 class Cloud(BaseModel):
+    model_config = ConfigDict(defer_build=True)
     arch: Literal["x86", "arm"] | None = Field(
         default="x86", description="Architecture type used to run the step."
     )
@@ -128,6 +181,7 @@ class Cloud(BaseModel):
 
 
 class Aws(BaseModel):
+    model_config = ConfigDict(defer_build=True)
     access_key: str = Field(
         ...,
         alias="access-key",
@@ -143,6 +197,7 @@ class Aws(BaseModel):
 
 
 class Aws1(BaseModel):
+    model_config = ConfigDict(defer_build=True)
     oidc_role: str = Field(
         ...,
         alias="oidc-role",
@@ -151,7 +206,8 @@ class Aws1(BaseModel):
     )
 
 
-class ImageName(RootModel[str]):
+class ImageName(RootModel):
+    model_config = ConfigDict(defer_build=True)
     root: str = Field(
         ...,
         description="The name of the Docker image which may or may not include registry URL, tag, and digest value.",
@@ -162,6 +218,7 @@ class ImageName(RootModel[str]):
 class ImportPipeline(BaseModel):
     model_config = ConfigDict(
         extra="forbid",
+        defer_build=True,
     )
     import_: str = Field(
         ...,
@@ -173,6 +230,7 @@ class ImportPipeline(BaseModel):
 
 
 class ImageBase(BaseModel):
+    model_config = ConfigDict(defer_build=True)
     name: ImageName
     run_as_user: int | None = Field(
         default=0,
@@ -183,6 +241,7 @@ class ImageBase(BaseModel):
 
 
 class Variable(BaseModel):
+    model_config = ConfigDict(defer_build=True)
     allowed_values: list[str] | None = Field(
         default=None,
         alias="allowed-values",
@@ -198,6 +257,7 @@ class Variable(BaseModel):
 class VariablesItem(BaseModel):
     model_config = ConfigDict(
         extra="forbid",
+        defer_build=True,
     )
     variables: list[Variable] | None = Field(
         default=None,
@@ -208,6 +268,7 @@ class VariablesItem(BaseModel):
 
 
 class Changesets(BaseModel):
+    model_config = ConfigDict(defer_build=True)
     includePaths: list[str] = Field(
         ...,
         description="Condition which holds only if any of the modified files match any of the specified patterns.",
@@ -217,6 +278,7 @@ class Changesets(BaseModel):
 
 
 class Condition(BaseModel):
+    model_config = ConfigDict(defer_build=True)
     changesets: Changesets = Field(
         ...,
         description="Condition on the changesets involved in the pipeline.",
@@ -224,19 +286,17 @@ class Condition(BaseModel):
     )
 
 
-class Trigger(RootModel[Literal["automatic", "manual"]]):
-    root: Literal["automatic", "manual"]
+Trigger = Literal["automatic", "manual"]
 
 
-class FailFast(RootModel[bool]):
-    root: bool = Field(..., title="Fail Fast")
+FailFast = Annotated[bool, Field(title="Fail Fast")]
 
 
-class ArtifactsPaths(RootModel[list[str]]):
-    root: list[str] = Field(..., min_length=1)
+ArtifactsPaths = Annotated[list[str], Field(min_length=1)]
 
 
 class Pipe(BaseModel):
+    model_config = ConfigDict(defer_build=True)
     pipe: str = Field(
         ..., description="The full pipe identifier.", title="Pipe Identifier"
     )
@@ -247,26 +307,30 @@ class Pipe(BaseModel):
     )
 
 
-class RunsOnItem(RootModel[str]):
-    root: str = Field(
-        ..., description="Label of a runner.", max_length=50, title="Step Runner Label"
-    )
+RunsOnItem = Annotated[
+    str,
+    Field(description="Label of a runner.", max_length=50, title="Step Runner Label"),
+]
 
 
 class Runtime(BaseModel):
+    model_config = ConfigDict(defer_build=True)
     cloud: Cloud | None = None
 
 
 class CacheExpanded(BaseModel):
+    model_config = ConfigDict(defer_build=True)
     key: Key | None = Field(default=None, title="Cache Key")
     path: CachePath
 
 
 class ImageAwsAuth(ImageBase):
+    model_config = ConfigDict(defer_build=True)
     aws: Aws | Aws1
 
 
 class ImageBasicAuth(ImageBase):
+    model_config = ConfigDict(defer_build=True)
     password: str = Field(
         ...,
         description="The password to use when fetching the Docker image.",
@@ -280,16 +344,26 @@ class ImageBasicAuth(ImageBase):
 
 
 class ImageNoAuth(ImageBase):
+    model_config = ConfigDict(defer_build=True)
     aws: Any | None = None
     password: Any | None = None
     username: Any | None = None
 
 
-class Script(RootModel[list[str | Pipe | ScriptItemAnchor]]):
-    root: list[str | Pipe | ScriptItemAnchor] = Field(..., min_length=1)
+class Script(RootModel):
+    model_config = ConfigDict(defer_build=True)
+    root: list[
+        Annotated[
+            Annotated[str, Tag("str")]
+            | Annotated[Pipe, Tag("pipe")]
+            | Annotated[ScriptItemAnchor, Tag("anchor")],
+            Discriminator(_get_script_item_tag),
+        ]
+    ] = Field(..., min_length=1)
 
 
 class ArtifactsExpanded(BaseModel):
+    model_config = ConfigDict(defer_build=True)
     download: bool | None = Field(
         default=True,
         description="Enables downloading of all available artifacts at the start of a step.",
@@ -297,18 +371,20 @@ class ArtifactsExpanded(BaseModel):
     paths: ArtifactsPaths | None = None
 
 
-class RunsOnExpanded(RootModel[list[RunsOnItem]]):
-    root: list[RunsOnItem] = Field(
-        ...,
+RunsOnExpanded = Annotated[
+    list[RunsOnItem],
+    Field(
         description="Required labels of a runner to run the step.",
         examples=[["self.hosted", "linux"]],
         max_length=10,
         min_length=1,
         title="Step Runner Labels",
-    )
+    ),
+]
 
 
 class Options(BaseModel):
+    model_config = ConfigDict(defer_build=True)
     docker: bool | None = Field(
         default=False, description="Enables Docker service for every step."
     )
@@ -317,15 +393,21 @@ class Options(BaseModel):
     size: Size | None = None
 
 
-class Cache(RootModel[CachePath | CacheExpanded]):
-    root: CachePath | CacheExpanded
+class Cache(RootModel):
+    model_config = ConfigDict(defer_build=True)
+    root: Annotated[
+        Annotated[CachePath, Tag("str")] | Annotated[CacheExpanded, Tag("dict")],
+        Discriminator(_get_shape_tag),
+    ]
 
 
-class Image(RootModel[ImageNoAuth | ImageBasicAuth | ImageAwsAuth | ImageName]):
+class Image(RootModel):
+    model_config = ConfigDict(defer_build=True)
     root: ImageNoAuth | ImageBasicAuth | ImageAwsAuth | ImageName
 
 
 class Service(BaseModel):
+    model_config = ConfigDict(defer_build=True)
     image: Image | None = None
     memory: int | None = Field(
         default=1024,
@@ -344,15 +426,25 @@ class Service(BaseModel):
     )
 
 
-class Artifacts(RootModel[ArtifactsPaths | ArtifactsExpanded]):
-    root: ArtifactsPaths | ArtifactsExpanded
+class Artifacts(RootModel):
+    model_config = ConfigDict(defer_build=True)
+    root: Annotated[
+        Annotated[ArtifactsPaths, Tag("list")]
+        | Annotated[ArtifactsExpanded, Tag("dict")],
+        Discriminator(_get_shape_tag),
+    ]
 
 
-class RunsOn(RootModel[RunsOnItem | RunsOnExpanded]):
-    root: RunsOnItem | RunsOnExpanded
+class RunsOn(RootModel):
+    model_config = ConfigDict(defer_build=True)
+    root: Annotated[
+        Annotated[RunsOnItem, Tag("str")] | Annotated[RunsOnExpanded, Tag("list")],
+        Discriminator(_get_shape_tag),
+    ]
 
 
 class StepBase(BaseModel):
+    model_config = ConfigDict(defer_build=True)
     after_script: Script | None = Field(
         default=None,
         alias="after-script",
@@ -414,14 +506,17 @@ class StepBase(BaseModel):
 
 
 class Step2(StepBase):
+    model_config = ConfigDict(defer_build=True)
     condition: Any | None = None
 
 
 class Step1(BaseModel):
+    model_config = ConfigDict(defer_build=True)
     step: Step2
 
 
 class Stage(BaseModel):
+    model_config = ConfigDict(defer_build=True)
     condition: Condition | None = Field(
         default=None,
         description="The condition to execute the stage.",
@@ -449,6 +544,7 @@ class Stage(BaseModel):
 
 
 class Step(StepBase):
+    model_config = ConfigDict(defer_build=True)
     condition: Condition | None = Field(
         default=None,
         description="The condition to execute the step.",
@@ -459,6 +555,7 @@ class Step(StepBase):
 class StageItem(BaseModel):
     model_config = ConfigDict(
         extra="forbid",
+        defer_build=True,
     )
     stage: Stage
 
@@ -466,11 +563,13 @@ class StageItem(BaseModel):
 class StepItem(BaseModel):
     model_config = ConfigDict(
         extra="forbid",
+        defer_build=True,
     )
     step: Step
 
 
-class ParallelSteps(RootModel[list[StepItem]]):
+class ParallelSteps(RootModel):
+    model_config = ConfigDict(defer_build=True)
     root: list[StepItem] = Field(
         ...,
         description="List of steps in the parallel group to run concurrently.",
@@ -480,6 +579,7 @@ class ParallelSteps(RootModel[list[StepItem]]):
 
 
 class ParallelExpanded(BaseModel):
+    model_config = ConfigDict(defer_build=True)
     fail_fast: FailFast | None = Field(
         default=None,
         alias="fail-fast",
@@ -488,19 +588,33 @@ class ParallelExpanded(BaseModel):
     steps: ParallelSteps
 
 
-class Parallel(RootModel[ParallelSteps | ParallelExpanded]):
-    root: ParallelSteps | ParallelExpanded
+class Parallel(RootModel):
+    model_config = ConfigDict(defer_build=True)
+    root: Annotated[
+        Annotated[ParallelSteps, Tag("list")]
+        | Annotated[ParallelExpanded, Tag("dict")],
+        Discriminator(_get_shape_tag),
+    ]
 
 
 class ParallelItem(BaseModel):
     model_config = ConfigDict(
         extra="forbid",
+        defer_build=True,
     )
     parallel: Parallel
 
 
-class Items(RootModel[list[StepItem | ParallelItem | StageItem]]):
-    root: list[StepItem | ParallelItem | StageItem] = Field(
+class Items(RootModel):
+    model_config = ConfigDict(defer_build=True)
+    root: list[
+        Annotated[
+            Annotated[StepItem, Tag("step")]
+            | Annotated[ParallelItem, Tag("parallel")]
+            | Annotated[StageItem, Tag("stage")],
+            Discriminator(_get_item_tag),
+        ]
+    ] = Field(
         ...,
         description="List of steps, stages and parallel groups of the pipeline.",
         min_length=1,
@@ -508,10 +622,17 @@ class Items(RootModel[list[StepItem | ParallelItem | StageItem]]):
     )
 
 
-class ItemsWithVariables(
-    RootModel[list[VariablesItem | StepItem | ParallelItem | StageItem]]
-):
-    root: list[VariablesItem | StepItem | ParallelItem | StageItem] = Field(
+class ItemsWithVariables(RootModel):
+    model_config = ConfigDict(defer_build=True)
+    root: list[
+        Annotated[
+            Annotated[VariablesItem, Tag("variables")]
+            | Annotated[StepItem, Tag("step")]
+            | Annotated[ParallelItem, Tag("parallel")]
+            | Annotated[StageItem, Tag("stage")],
+            Discriminator(_get_item_tag),
+        ]
+    ] = Field(
         ...,
         description="List of variables, steps, stages and parallel groups of the custom pipeline.",
         min_length=1,
@@ -519,23 +640,38 @@ class ItemsWithVariables(
     )
 
 
-class CustomPipeline(RootModel[ItemsWithVariables | ImportPipeline]):
-    root: ItemsWithVariables | ImportPipeline
+class CustomPipeline(RootModel):
+    model_config = ConfigDict(defer_build=True)
+    root: Annotated[
+        Annotated[ItemsWithVariables, Tag("list")]
+        | Annotated[ImportPipeline, Tag("dict")],
+        Discriminator(_get_shape_tag),
+    ]
 
 
-class Pipeline(RootModel[Items | ImportPipeline]):
-    root: Items | ImportPipeline
+class Pipeline(RootModel):
+    model_config = ConfigDict(defer_build=True)
+    root: Annotated[
+        Annotated[Items, Tag("list")] | Annotated[ImportPipeline, Tag("dict")],
+        Discriminator(_get_shape_tag),
+    ]
 
 
 class PullRequestsPipeline1(BaseModel):
+    model_config = ConfigDict(defer_build=True)
     destinations: dict[str, Pipeline] | None = None
 
 
-class PullRequestsPipeline(RootModel[Items | PullRequestsPipeline1]):
-    root: Items | PullRequestsPipeline1
+class PullRequestsPipeline(RootModel):
+    model_config = ConfigDict(defer_build=True)
+    root: Annotated[
+        Annotated[Items, Tag("list")] | Annotated[PullRequestsPipeline1, Tag("dict")],
+        Discriminator(_get_shape_tag),
+    ]
 
 
 class Definitions(BaseModel):
+    model_config = ConfigDict(defer_build=True)
     caches: dict[str, Cache] | None = Field(
         default=None, title="Custom cache definitions"
     )
@@ -553,6 +689,7 @@ class Definitions(BaseModel):
 
 
 class Pipelines(BaseModel):
+    model_config = ConfigDict(defer_build=True)
     branches: dict[str, Pipeline] | None = Field(
         default=None,
         description="Branch-specific build pipelines.",
@@ -580,6 +717,7 @@ class Pipelines(BaseModel):
 
 
 class PipelinesConfiguration(BaseModel):
+    model_config = ConfigDict(defer_build=True)
     clone: Clone | None = None
     definitions: Definitions | None = Field(
         default=None,
@@ -606,5 +744,6 @@ class PipelinesConfiguration(BaseModel):
     pipelines: Pipelines | None = Field(default=None, title="Pipelines")
 
 
-class Model(RootModel[PipelinesConfiguration]):
+class Model(RootModel):
+    model_config = ConfigDict(defer_build=True)
     root: PipelinesConfiguration
@@ -1,4 +1,12 @@
-from usethis._integrations.bitbucket.schema import Step, Step1
+from functools import singledispatch
+
+from usethis._integrations.bitbucket.schema import (
+    ParallelExpanded,
+    ParallelSteps,
+    Step,
+    Step1,
+    StepItem,
+)
 
 
 def step1tostep(step1: Step1) -> Step:
@@ -12,5 +20,21 @@ def step1tostep(step1: Step1) -> Step:
     """
     step2 = step1.step
 
-    step = Step(**step2.model_dump())
-    return step
+    # Dump by alias, since fields like 'after-script' can't be populated by name.
+    return Step.model_validate(step2.model_dump(by_alias=True, exclude_unset=True))
+
+
+@singledispatch
+def get_parallel_step_items(par: ParallelSteps | ParallelExpanded) -> list[StepItem]:
+    """Get the step items in a parallel block, regardless of its form."""
+    raise NotImplementedError
+
+
+@get_parallel_step_items.register
+def _(par: ParallelSteps) -> list[StepItem]:
+    return par.root
+
+
+@get_parallel_step_items.register
+def _(par: ParallelExpanded) -> list[StepItem]:
+    return par.steps.root
@@ -1,3 +1,4 @@
+import re
 from functools import singledispatch
 from pathlib import Path
 from typing import assert_never
@@ -9,12 +10,16 @@ from ruamel.yaml.scalarstring import LiteralScalarString
 import usethis._pipeweld.func
 from usethis._console import box_print, tick_print
 from usethis._integrations.bitbucket.anchor import ScriptItemAnchor, ScriptItemName
-from usethis._integrations.bitbucket.cache import _add_caches_via_doc, remove_cache
+from usethis._integrations.bitbucket.cache import (
+    _add_caches_via_doc,
+    _remove_cache_via_doc,
+)
 from usethis._integrations.bitbucket.dump import bitbucket_fancy_dump
 from usethis._integrations.bitbucket.errors import UnexpectedImportPipelineError
 from usethis._integrations.bitbucket.io import (
     BitbucketPipelinesYAMLDocument,
     edit_bitbucket_pipelines_yaml,
+    read_bitbucket_pipelines_yaml,
 )
 from usethis._integrations.bitbucket.pipeweld import (
     apply_pipeweld_instruction_via_doc,
@@ -30,13 +35,16 @@ from usethis._integrations.bitbucket.schema import (
     ParallelItem,
     ParallelSteps,
     Pipeline,
+    PipelinesConfiguration,
     Script,
     StageItem,
     Step,
     StepItem,
 )
-from usethis._integrations.bitbucket.schema_utils import step1tostep
-from usethis._integrations.uv.python import get_supported_major_python_versions
+from usethis._integrations.bitbucket.schema_utils import (
+    get_parallel_step_items,
+    step1tostep,
+)
 from usethis._integrations.yaml.update import update_ruamel_yaml_map
 
 _CACHE_LOOKUP = {
@@ -47,6 +55,9 @@ _CACHE_LOOKUP = {
 
 _PLACEHOLDER_NAME = "Placeholder - add your own steps!"
 
+# The name of the step which runs the tests on each supported Python version.
+TEST_STEP_NAME_REGEX = re.compile(r"^Test on 3\.(\d+)$")
+
 _SCRIPT_ITEM_LOOKUP: dict[ScriptItemName, LiteralScalarString] = {
     "install-uv": LiteralScalarString("""\
 curl -LsSf https://astral.sh/uv/install.sh | sh
@@ -74,9 +85,17 @@ def add_step_in_default(step: Step) -> None:
         if _steps_are_equivalent(existing_step, step):
             return
 
-    # Add the step to the default pipeline
+    placeholder = _get_placeholder_step()
+
     with edit_bitbucket_pipelines_yaml() as doc:
+        # Add the step to the default pipeline
         _add_step_in_default_via_doc(step, doc=doc)
+
+        # Remove the placeholder step if it already exists
+        if not _steps_are_equivalent(placeholder, step):
+            # Only remove the placeholder if it hasn't already been added.
+            _remove_step_from_default_via_doc(placeholder, doc=doc)
+
         dump = bitbucket_fancy_dump(doc.model, reference=doc.content)
         update_ruamel_yaml_map(
             doc.content,
@@ -84,12 +103,6 @@ def add_step_in_default(step: Step) -> None:
             preserve_comments=True,
         )
 
-    # Remove the placeholder step if it already exists
-    placeholder = _get_placeholder_step()
-    if not _steps_are_equivalent(placeholder, step):
-        # Only remove the placeholder if it hasn't already been added.
-        remove_step_from_default(placeholder)
-
 
 def _add_step_in_default_via_doc(
     step: Step, *, doc: BitbucketPipelinesYAMLDocument
@@ -105,63 +118,38 @@ def _add_step_in_default_via_doc(
             f"'bitbucket-pipelines.yml'."
         )
 
-    config = doc.model
-
-    step = step.model_copy(deep=True)
-
     # If the step uses an anchorized script definition, add it to the definitions
     # section
-    for idx, script_item in enumerate(step.script.root):
-        if isinstance(script_item, ScriptItemAnchor):
-            # We've found an anchorized script definition...
-
-            # Get the names of the anchors which are already defined in the file.
-            defined_script_item_by_name = get_defined_script_items_via_doc(doc=doc)
-
-            # If our anchor doesn't have a definition yet, we need to add it.
-            if script_item.name not in defined_script_item_by_name:
-                try:
-                    script_item = _SCRIPT_ITEM_LOOKUP[script_item.name]
-                except KeyError:
-                    msg = f"Unrecognized script item anchor: {script_item.name}"
-                    raise NotImplementedError(msg) from None
-
-                if config.definitions is None:
-                    config.definitions = Definitions()
-
-                script_items = config.definitions.script_items
-
-                if script_items is None:
-                    script_items = CommentedSeq()
-                    config.definitions.script_items = script_items
-
-                # N.B. Once we support multiple different types of script items, we will
-                # probably want to enforce a canonical order rather than just append.
-                # See also anchor.py.
-                script_items.append(script_item)
-                script_items = CommentedSeq(script_items)
-            else:
-                # Otherwise, if the anchor is already defined, we need to use the
-                # reference
-                script_item = defined_script_item_by_name[script_item.name]
-
-            step.script.root[idx] = script_item
-
-    # If the step is unrecognized, it will go at the end.
+    if any(
+        isinstance(script_item, ScriptItemAnchor) for script_item in step.script.root
+    ):
+        # Get the names of the anchors which are already defined in the file.
+        defined_script_item_by_name = get_defined_script_items_via_doc(doc=doc)
+
+        # Build a new script rather than modifying the original step's script.
+        script = step.script.model_copy()
+        script.root = [
+            _get_script_item_definition_via_doc(
+                script_item,
+                defined_script_item_by_name=defined_script_item_by_name,
+                doc=doc,
+            )
+            if isinstance(script_item, ScriptItemAnchor)
+            else script_item
+            for script_item in step.script.root
+        ]
+        step = step.model_copy(update={"script": script})
+
+    # Recognized steps which come earlier in the canonical order must precede the
+    # new step. If the step is unrecognized, it will go at the end.
+    step_rank = _get_step_rank(step)
     prerequisites: set[str] = set()
-
-    # N.B. Currently, we are not accounting for parallelism, whereas all these steps
-    # could be parallel potentially.
-    # See https://github.com/nathanjmcdougall/usethis-python/issues/149
-    step_order = [
-        "Run pre-commit",
-        *[f"Test on 3.{maj}" for maj in get_supported_major_python_versions()],
-    ]
-
-    for step_name in step_order:
-        if step_name == step.name:
-            break
-        prerequisites.add(step_name)
+    for existing_step in _get_steps_in_default_via_model(doc.model):
+        existing_rank = _get_step_rank(existing_step)
+        if existing_rank is None:
+            continue
+        if step_rank is None or existing_rank < step_rank:
+            prerequisites.add(get_pipeweld_step(existing_step))
 
     weld_result = usethis._pipeweld.func.Adder(
         pipeline=get_pipeweld_pipeline_from_default(doc.model),
@@ -174,6 +162,67 @@ def _add_step_in_default_via_doc(
         )
 
 
+def _get_step_rank(step: Step) -> tuple[int, int] | None:
+    """The position of a recognized step in the canonical order of the default pipeline.
+
+    The pre-commit step comes first, followed by the test steps in order of Python
+    version. Unrecognized steps have no rank.
+    """
+    # N.B. Currently, we are not accounting for parallelism, whereas all these steps
+    # could be parallel potentially.
+    # See https://github.com/nathanjmcdougall/usethis-python/issues/149
+    if step.name == "Run pre-commit":
+        return (0, 0)
+
+    if step.name is not None:
+        match = TEST_STEP_NAME_REGEX.match(step.name)
+        if match:
+            return (1, int(match.group(1)))
+
+    return None
+
+
+def _get_script_item_definition_via_doc(
+    script_item: ScriptItemAnchor,
+    *,
+    defined_script_item_by_name: dict[str, str],
+    doc: BitbucketPipelinesYAMLDocument,
+) -> str:
+    """Get the definition for an anchorized script item, adding it if necessary.
+
+    Any new definition is also recorded in `defined_script_item_by_name`.
+    """
+    config = doc.model
+
+    # If our anchor already has a definition, we need to use the reference
+    if script_item.name in defined_script_item_by_name:
+        return defined_script_item_by_name[script_item.name]
+
+    # Otherwise, we need to add the definition.
+    try:
+        definition = _SCRIPT_ITEM_LOOKUP[script_item.name]
+    except KeyError:
+        msg = f"Unrecognized script item anchor: {script_item.name}"
+        raise NotImplementedError(msg) from None
+
+    if config.definitions is None:
+        config.definitions = Definitions()
+
+    script_items = config.definitions.script_items
+
+    if script_items is None:
+        script_items = CommentedSeq()
+        config.definitions.script_items = script_items
+
+    # N.B. Once we support multiple different types of script items, we will
+    # probably want to enforce a canonical order rather than just append.
+    # See also anchor.py.
+    script_items.append(definition)
+    defined_script_item_by_name[script_item.name] = definition
+
+    return definition
+
+
 def remove_step_from_default(step: Step) -> None:
     """Remove a step from the default pipeline in the Bitbucket Pipelines configuration.
 
@@ -182,6 +231,15 @@ def remove_step_from_default(step: Step) -> None:
     if not (Path.cwd() / "bitbucket-pipelines.yml").exists():
         return
 
+    with edit_bitbucket_pipelines_yaml() as doc:
+        _remove_step_from_default_via_doc(step, doc=doc)
+        dump = bitbucket_fancy_dump(doc.model, reference=doc.content)
+        update_ruamel_yaml_map(doc.content, dump, preserve_comments=True)
+
+
+def _remove_step_from_default_via_doc(
+    step: Step, *, doc: BitbucketPipelinesYAMLDocument
+) -> None:
     if step.name == _PLACEHOLDER_NAME:
         pass  # We need to selectively choose to report at a higher level.
         # It's not always notable that the placeholder is being removed.
@@ -190,43 +248,39 @@ def remove_step_from_default(step: Step) -> None:
             f"Removing '{step.name}' from default pipeline in 'bitbucket-pipelines.yml'."
         )
 
-    with edit_bitbucket_pipelines_yaml() as doc:
-        config = doc.model
+    config = doc.model
 
-        if config.pipelines is None:
-            return
+    if config.pipelines is None:
+        return
 
-        if config.pipelines.default is None:
-            return
+    if config.pipelines.default is None:
+        return
 
-        pipeline = config.pipelines.default
+    pipeline = config.pipelines.default
 
-        if isinstance(pipeline.root, ImportPipeline):
-            msg = "Cannot remove steps from an import pipeline."
-            raise UnexpectedImportPipelineError(msg)
+    if isinstance(pipeline.root, ImportPipeline):
+        msg = "Cannot remove steps from an import pipeline."
+        raise UnexpectedImportPipelineError(msg)
 
-        items = pipeline.root.root
+    items = pipeline.root.root
 
-        # Iterate over the items. Any item that contains the step is censored to remove
-        # references to the step. If the only thing in the item is the step, we get None
-        new_items: list[StepItem | ParallelItem | StageItem] = []
-        for item in items:
-            new_item = _censor_step(item, step=step)
-            if new_item is not None:
-                new_items.append(new_item)
-        pipeline.root.root = new_items
+    # Iterate over the items. Any item that contains the step is censored to remove
+    # references to the step. If the only thing in the item is the step, we get None
+    new_items: list[StepItem | ParallelItem | StageItem] = []
+    for item in items:
+        new_item = _censor_step(item, step=step)
+        if new_item is not None:
+            new_items.append(new_item)
+    pipeline.root.root = new_items
 
-        if len(new_items) == 0:
-            placeholder = _get_placeholder_step()
-            _add_step_in_default_via_doc(placeholder, doc=doc)
-
-        dump = bitbucket_fancy_dump(doc.model, reference=doc.content)
-        update_ruamel_yaml_map(doc.content, dump, preserve_comments=True)
+    if len(new_items) == 0:
+        placeholder = _get_placeholder_step()
+        _add_step_in_default_via_doc(placeholder, doc=doc)
 
     if step.caches is not None:
         for cache in step.caches:
-            if not is_cache_used(cache):
-                remove_cache(cache)
+            if not _is_cache_used_via_doc(cache, doc=doc):
+                _remove_cache_via_doc(cache, doc=doc)
 
 
 @singledispatch
@@ -247,13 +301,7 @@ def _(item: StepItem, *, step: Step) -> StepItem | ParallelItem | StageItem | No
 @_censor_step.register(ParallelItem)
 def _(item: ParallelItem, *, step: Step) -> StepItem | ParallelItem | StageItem | None:
     par = item.parallel.root
-
-    if isinstance(par, ParallelSteps):
-        step_items = par.root
-    elif isinstance(par, ParallelExpanded):
-        step_items = par.steps.root
-    else:
-        assert_never(par)
+    step_items = get_parallel_step_items(par)
 
     new_step_items: list[StepItem] = []
     for step_item in step_items:
@@ -261,9 +309,12 @@ def _(item: ParallelItem, *, step: Step) -> StepItem | ParallelItem | StageItem
             continue
         new_step_items.append(step_item)
 
-    if len(new_step_items) == 0:
+    if len(new_step_items) == len(step_items):
+        # The step isn't in this parallel block, so there's nothing to rebuild.
+        return item
+    elif len(new_step_items) == 0:
         return None
-    elif len(new_step_items) == 1 and len(step_items) != 1:
+    elif len(new_step_items) == 1:
         return new_step_items[0]
     elif isinstance(par, ParallelSteps):
         return ParallelItem(parallel=Parallel(ParallelSteps(new_step_items)))
@@ -284,7 +335,10 @@ def _(item: StageItem, *, step: Step) -> StepItem | ParallelItem | StageItem | N
             continue
         new_step1s.append(step1)
 
-    if len(new_step1s) == 0:
+    if len(new_step1s) == len(step1s):
+        # The step isn't in this stage, so there's nothing to rebuild.
+        return item
+    elif len(new_step1s) == 0:
         return None
 
     new_stage = item.stage.model_copy()
@@ -300,6 +354,14 @@ def is_cache_used(cache: str) -> bool:
     return False
 
 
+def _is_cache_used_via_doc(cache: str, *, doc: BitbucketPipelinesYAMLDocument) -> bool:
+    for step in _get_steps_in_default_via_model(doc.model):
+        if step.caches is not None and cache in step.caches:
+            return True
+
+    return False
+
+
 def _add_step_caches_via_doc(
     step: Step, *, doc: BitbucketPipelinesYAMLDocument
 ) -> None:
@@ -327,9 +389,14 @@ def _steps_are_equivalent(step1: Step | None, step2: Step) -> bool:
         return True
 
     # Same contents, different name
-    step1 = step1.model_copy()
-    step1.name = step2.name
-    return step1 == step2
+    if type(step1) is not type(step2):
+        return False
+
+    return all(
+        getattr(step1, field) == getattr(step2, field)
+        for field in type(step1).model_fields
+        if field != "name"
+    )
 
 
 def get_steps_in_default() -> list[Step]:
@@ -346,9 +413,10 @@ def get_steps_in_default() -> list[Step]:
     if not (Path.cwd() / "bitbucket-pipelines.yml").exists():
         return []
 
-    with edit_bitbucket_pipelines_yaml() as doc:
-        config = doc.model
+    return _get_steps_in_default_via_model(read_bitbucket_pipelines_yaml())
+
 
+def _get_steps_in_default_via_model(config: PipelinesConfiguration) -> list[Step]:
     if config.pipelines is None:
         return []
 
@@ -385,21 +453,13 @@ def _(item: StepItem) -> list[Step]:
 
 @get_steps_in_pipeline_item.register(ParallelItem)
 def _(item: ParallelItem) -> list[Step]:
-    _p = item.parallel.root
-    if isinstance(_p, ParallelSteps):
-        step_items = _p.root
-    elif isinstance(_p, ParallelExpanded):
-        step_items = _p.steps.root
-    else:
-        assert_never(_p)
-
-    steps = [step_item.step for step_item in step_items if step_item.step is not None]
-    return steps
+    step_items = get_parallel_step_items(item.parallel.root)
+    return [step_item.step for step_item in step_items]
 
 
 @get_steps_in_pipeline_item.register(StageItem)
 def _(item: StageItem) -> list[Step]:
-    return [step1tostep(step1) for step1 in item.stage.steps if step1.step is not None]
+    return [step1tostep(step1) for step1 in item.stage.steps]
 
 
 def add_placeholder_step_in_default(report_placeholder: bool = True) -> None:
@@ -1,11 +1,26 @@
+import json
+import os
+from pathlib import Path
+
 import requests
+from requests.adapters import HTTPAdapter
 
 from usethis._integrations.github.errors import GitHubTagError, NoGitHubTagsFoundError
 
+# Reuse the connection when several tags are fetched in the same run.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=2))
+_SESSION.headers.update(
+    {"Accept": "application/vnd.github+json", "User-Agent": "usethis-python"}
+)
+
 
 def get_github_latest_tag(owner: str, repo: str) -> str:
     """Get the name of the most recent tag on the default branch of a GitHub repository.
 
+    The last response is cached on disk with its ETag, so that when the tags haven't
+    changed, GitHub can reply with '304 Not Modified' and the cached tag is used.
+
     Args:
         owner: GitHub repository owner (username or organization).
         repo: GitHub repository name.
@@ -18,17 +33,27 @@ def get_github_latest_tag(owner: str, repo: str) -> str:
         NoTagsFoundError: If the repository has no tags.
     """
 
-    # GitHub API URL for repository tags
-    api_url = f"https://api.github.com/repos/{owner}/{repo}/tags"
+    # GitHub API URL for repository tags; only the most recent one is needed
+    api_url = f"https://api.github.com/repos/{owner}/{repo}/tags?per_page=1"
+
+    cache_path = _get_cache_dir() / owner / f"{repo}.json"
+    cache_entry = _read_cache_entry(cache_path)
+
+    headers: dict[str, str] = {}
+    if cache_entry is not None:
+        headers["If-None-Match"] = cache_entry["etag"]
 
     # Fetch the tags using the GitHub API
     try:
-        response = requests.get(api_url, timeout=1)
+        response = _SESSION.get(api_url, headers=headers, timeout=1)
         response.raise_for_status()  # Raise an error for HTTP issues
     except (requests.exceptions.HTTPError, requests.exceptions.ConnectionError) as err:
         msg = f"Failed to fetch tags from GitHub API: {err}"
         raise GitHubTagError(msg)
 
+    if response.status_code == 304 and cache_entry is not None:
+        return cache_entry["tag"]
+
     tags = response.json()
 
     if not tags:
@@ -36,4 +61,42 @@ def get_github_latest_tag(owner: str, repo: str) -> str:
         raise NoGitHubTagsFoundError(msg)
 
     # Most recent tag's name
-    return tags[0]["name"]
+    tag = tags[0]["name"]
+
+    etag = response.headers.get("ETag")
+    if etag is not None:
+        _write_cache_entry(cache_path, {"etag": etag, "tag": tag})
+
+    return tag
+
+
+def _get_cache_dir() -> Path:
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    if cache_home:
+        return Path(cache_home) / "usethis" / "github-tags"
+    return Path.home() / ".cache" / "usethis" / "github-tags"
+
+
+def _read_cache_entry(path: Path) -> dict[str, str] | None:
+    try:
+        entry = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(entry, dict):
+        return None
+    if not isinstance(entry.get("etag"), str) or not isinstance(entry.get("tag"), str):
+        return None
+
+    return entry
+
+
+def _write_cache_entry(path: Path, entry: dict[str, str]) -> None:
+    # The cache is best-effort; never fail just because it can't be written.
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(entry))
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
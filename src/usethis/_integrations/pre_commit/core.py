@@ -2,18 +2,23 @@ from pathlib import Path
 
 from usethis._console import tick_print
 from usethis._integrations.pre_commit.errors import PreCommitInstallationError
+from usethis._integrations.pre_commit.io import flush_pre_commit_config_yaml
 from usethis._integrations.uv.call import call_uv_subprocess
 from usethis._integrations.uv.errors import UVSubprocessFailedError
 
 
 def remove_pre_commit_config() -> None:
     name = ".pre-commit-config.yaml"
-    if not (Path.cwd() / name).exists():
+    path = Path.cwd() / name
+    if not path.exists():
         # Early exit; the file already doesn't exist
         return
 
+    # Don't leave batched edits around to recreate the file later.
+    flush_pre_commit_config_yaml()
+
     tick_print(f"Removing '{name}'.")
-    (Path.cwd() / name).unlink()
+    path.unlink()
 
 
 def install_pre_commit_hooks() -> None:
@@ -23,9 +28,11 @@ def install_pre_commit_hooks() -> None:
     in a git repo.
     """
 
+    flush_pre_commit_config_yaml()
+
     tick_print("Ensuring pre-commit hooks are installed.")
     try:
-        call_uv_subprocess(["run", "pre-commit", "install"])
+        call_uv_subprocess(["run", "pre-commit", "install"], change_toml=False)
     except UVSubprocessFailedError as err:
         msg = f"Failed to install pre-commit hooks:\n{err}"
         raise PreCommitInstallationError(msg) from None
@@ -38,9 +45,11 @@ def uninstall_pre_commit_hooks() -> None:
     in a git repo.
     """
 
+    flush_pre_commit_config_yaml()
+
     tick_print("Ensuring pre-commit hooks are uninstalled.")
     try:
-        call_uv_subprocess(["run", "pre-commit", "uninstall"])
+        call_uv_subprocess(["run", "pre-commit", "uninstall"], change_toml=False)
     except UVSubprocessFailedError as err:
         msg = f"Failed to uninstall pre-commit hooks:\n{err}"
         raise PreCommitInstallationError(msg) from None
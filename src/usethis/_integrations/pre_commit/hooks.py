@@ -1,9 +1,11 @@
-from collections import Counter
 from pathlib import Path
 
 from usethis._console import box_print, tick_print
 from usethis._integrations.pre_commit.dump import pre_commit_fancy_dump
-from usethis._integrations.pre_commit.io import edit_pre_commit_config_yaml
+from usethis._integrations.pre_commit.io import (
+    edit_pre_commit_config_yaml,
+    read_pre_commit_config_yaml,
+)
 from usethis._integrations.pre_commit.schema import (
     HookDefinition,
     JsonSchemaForPreCommitConfigYaml,
@@ -100,24 +102,28 @@ def insert_repo(
     # after the last precedent
 
     repos = []
+    is_inserted = False
     for repo in existing_repos:
         hooks = repo.hooks
         if hooks is None:
             hooks = []
 
+        hook_ids = [hook.id for hook in hooks]
+
         # Don't include the placeholder from now on, since we're adding a repo
         # which can be there instead.
-        if [hook.id for hook in hooks] != [_PLACEHOLDER_ID]:
+        if hook_ids != [_PLACEHOLDER_ID]:
             repos.append(repo)
 
-        for hook in hooks:
-            if hook.id == predecessor:
-                if repo_to_insert.hooks is not None:
-                    for inserted_hook in repo_to_insert.hooks:
-                        tick_print(
-                            f"Adding hook '{inserted_hook.id}' to '.pre-commit-config.yaml'."
-                        )
-                repos.append(repo_to_insert)
+        # Only insert once, even if the predecessor is somehow duplicated.
+        if not is_inserted and predecessor in hook_ids:
+            if repo_to_insert.hooks is not None:
+                for inserted_hook in repo_to_insert.hooks:
+                    tick_print(
+                        f"Adding hook '{inserted_hook.id}' to '.pre-commit-config.yaml'."
+                    )
+            repos.append(repo_to_insert)
+            is_inserted = True
 
     return repos
 
@@ -151,20 +157,26 @@ def remove_hook(name: str) -> None:
     """
     with edit_pre_commit_config_yaml() as doc:
         # search across the repos for any hooks with ID equal to name
+        new_repos: list[LocalRepo | UriRepo | MetaRepo] = []
         for repo in doc.model.repos:
             if isinstance(repo, MetaRepo) or repo.hooks is None:
+                new_repos.append(repo)
                 continue
 
+            new_hooks: list[HookDefinition] = []
             for hook in repo.hooks:
                 if hook.id == name:
                     tick_print(
                         f"Removing hook '{hook.id}' from '.pre-commit-config.yaml'."
                     )
-                    repo.hooks.remove(hook)
+                else:
+                    new_hooks.append(hook)
+            repo.hooks = new_hooks
 
             # if repo has no hooks, remove it
-            if not repo.hooks:
-                doc.model.repos.remove(repo)
+            if new_hooks:
+                new_repos.append(repo)
+        doc.model.repos = new_repos
 
         # If there are no more hooks, we should add a placeholder.
         if not doc.model.repos:
@@ -180,23 +192,23 @@ def get_hook_names() -> list[str]:
     if not path.exists():
         return []
 
-    with edit_pre_commit_config_yaml() as doc:
-        return extract_hook_names(doc.model)
+    return extract_hook_names(read_pre_commit_config_yaml())
 
 
 def extract_hook_names(model: JsonSchemaForPreCommitConfigYaml) -> list[str]:
     hook_names = []
+    seen_hook_names = set()
     for repo in model.repos:
         if repo.hooks is None:
             continue
 
         for hook in repo.hooks:
-            hook_names.append(hook.id)
+            # Need to validate there are no duplicates
+            if hook.id in seen_hook_names:
+                msg = f"Hook name '{hook.id}' is duplicated"
+                raise DuplicatedHookNameError(msg)
 
-    # Need to validate there are no duplciates
-    for name, count in Counter(hook_names).items():
-        if count > 1:
-            msg = f"Hook name '{name}' is duplicated"
-            raise DuplicatedHookNameError(msg)
+            seen_hook_names.add(hook.id)
+            hook_names.append(hook.id)
 
     return hook_names
@@ -1,14 +1,15 @@
 from collections.abc import Generator
-from contextlib import contextmanager
+from contextlib import ExitStack, contextmanager
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
-from pydantic import ValidationError
+from pydantic import BaseModel, ConfigDict, ValidationError
 from ruamel.yaml.comments import CommentedMap
 
 from usethis._console import tick_print
 from usethis._integrations.pre_commit.schema import JsonSchemaForPreCommitConfigYaml
-from usethis._integrations.yaml.io import YAMLLiteral, edit_yaml
+from usethis._integrations.yaml.io import YAMLLiteral, edit_yaml, parse_yaml
 
 
 class PreCommitConfigYAMLConfigError(Exception):
@@ -28,9 +29,122 @@ class PreCommitConfigYAMLDocument:
     model: JsonSchemaForPreCommitConfigYaml
 
 
+class _PreCommitConfigYAMLBatchState(BaseModel):
+    """Global-state for batching edits to '.pre-commit-config.yaml'.
+
+    Attributes:
+        depth: The number of currently open `batch_pre_commit_config_yaml_edits`
+               contexts.
+        document: The document shared by every edit while a batch is open.
+        exit_stack: Holds the open edit of the shared document; closing it writes the
+                    document to disk, whereas exiting it with an error abandons it.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    depth: int = 0
+    document: PreCommitConfigYAMLDocument | None = None
+    exit_stack: ExitStack | None = None
+
+
+_batch_state = _PreCommitConfigYAMLBatchState()
+
+
+@contextmanager
+def batch_pre_commit_config_yaml_edits() -> Generator[None, None, None]:
+    """A context manager to batch modifications to '.pre-commit-config.yaml'.
+
+    Within the context, every `edit_pre_commit_config_yaml` shares a single document,
+    which is only read when first needed and written when the outermost context exits.
+    If an error is raised out of the outermost context, the shared document is
+    discarded without being written. Contexts can be nested.
+    """
+    _batch_state.depth += 1
+    try:
+        yield
+    except BaseException as err:
+        if _batch_state.depth == 1:
+            # The shared document may have been left half-modified. Within a nested
+            # context, the error might still be handled by an enclosing context, so
+            # leave it for the outermost one to decide.
+            _discard_pre_commit_config_yaml(err)
+        raise
+    finally:
+        _batch_state.depth -= 1
+
+    if _batch_state.depth == 0:
+        flush_pre_commit_config_yaml()
+
+
+def flush_pre_commit_config_yaml() -> None:
+    """Write any batched '.pre-commit-config.yaml' changes to disk.
+
+    This should be called before handing over to another process which might read
+    '.pre-commit-config.yaml', or before removing the file.
+    """
+    exit_stack = _batch_state.exit_stack
+    _batch_state.document = None
+    _batch_state.exit_stack = None
+
+    if exit_stack is not None:
+        exit_stack.close()
+
+
+def _discard_pre_commit_config_yaml(err: BaseException) -> None:
+    """Forget any batched '.pre-commit-config.yaml' changes without writing them."""
+    exit_stack = _batch_state.exit_stack
+    _batch_state.document = None
+    _batch_state.exit_stack = None
+
+    if exit_stack is not None:
+        # Passing the error on to the open edit abandons it, just like an error within
+        # an unbatched edit, so the file is neither validated nor written.
+        exit_stack.__exit__(type(err), err, err.__traceback__)
+
+
 @contextmanager
 def edit_pre_commit_config_yaml() -> Generator[PreCommitConfigYAMLDocument, None, None]:
     """A context manager to modify '.pre-commit-config.yaml' in-place."""
+    if _batch_state.depth == 0:
+        with _edit_pre_commit_config_yaml() as doc:
+            yield doc
+        return
+
+    if _batch_state.document is None:
+        exit_stack = ExitStack()
+        _batch_state.document = exit_stack.enter_context(_edit_pre_commit_config_yaml())
+        _batch_state.exit_stack = exit_stack
+
+    # The shared document is validated once, when the batch is written, rather than
+    # after every edit within it.
+    yield _batch_state.document
+
+
+def read_pre_commit_config_yaml() -> JsonSchemaForPreCommitConfigYaml:
+    """Read the configuration in '.pre-commit-config.yaml' without modifying it.
+
+    The configuration is cached on the contents of the file and shared between calls,
+    so it must not be modified. Use `edit_pre_commit_config_yaml` to make changes.
+    """
+    if _batch_state.document is not None:
+        # Don't bypass changes which haven't been written to disk yet.
+        return _batch_state.document.model
+
+    path = Path.cwd() / ".pre-commit-config.yaml"
+    return _parse_pre_commit_config_yaml(path.read_text(), path=path)
+
+
+@lru_cache(maxsize=8)
+def _parse_pre_commit_config_yaml(
+    text: str, *, path: Path
+) -> JsonSchemaForPreCommitConfigYaml:
+    return _validate_config(parse_yaml(text, yaml_path=path))
+
+
+@contextmanager
+def _edit_pre_commit_config_yaml() -> (
+    Generator[PreCommitConfigYAMLDocument, None, None]
+):
     name = ".pre-commit-config.yaml"
     path = Path.cwd() / name
 
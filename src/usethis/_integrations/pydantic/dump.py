@@ -82,18 +82,12 @@ def _(
 ) -> ModelRepresentation:
     if order_by_cls is None:
         order_by_cls = {}
+
+    reference_dict = _get_reference_dict(reference)
+
     d = {}
     for key, value in model.items():
-        if reference is None:
-            value_ref = None
-        elif isinstance(reference, dict | BaseModel):
-            try:
-                value_ref = dict(reference)[key]
-            except (KeyError, TypeError):
-                value_ref = None
-        else:
-            value_ref = None
-
+        value_ref = reference_dict.get(key)
         d[key] = fancy_model_dump(value, reference=value_ref, order_by_cls=order_by_cls)
 
     return d
@@ -129,18 +123,15 @@ def _(
     if order_by_cls is None:
         order_by_cls = {}
 
+    reference_dict = _get_reference_dict(reference)
+
     d = {}
     for key, value in model:
-        default_value = model.model_fields[key].default
+        field_info = model.model_fields[key]
+        default_value = field_info.default
 
         # The reference for the value (for recursion)
-        if isinstance(reference, dict | BaseModel):
-            try:
-                value_ref = dict(reference)[key]
-            except KeyError:
-                value_ref = None
-        else:
-            value_ref = None
+        value_ref = reference_dict.get(key)
 
         # If the model has default value, we usually won't dump it.
         # There is an exception though: if we have a reference which we are trying
@@ -158,7 +149,7 @@ def _(
             continue
 
         # Find the key for display - there might be an alias
-        display_key = model.model_fields[key].alias
+        display_key = field_info.alias
         if display_key is None:
             display_key = key
 
@@ -178,3 +169,16 @@ def _(
     ordered_d.update(d)
 
     return ordered_d
+
+
+def _get_reference_dict(
+    reference: ModelRepresentation | None,
+) -> dict[str, ModelRepresentation]:
+    """Get a reference as a dict, so it only needs converting once per model."""
+    if not isinstance(reference, dict | BaseModel):
+        return {}
+
+    try:
+        return dict(reference)
+    except TypeError:
+        return {}
@@ -1,29 +1,36 @@
-from typing import Any
+from typing import Any, cast
 
-import mergedeep
 from pydantic import TypeAdapter
-from tomlkit import TOMLDocument
 
 from usethis._integrations.pyproject.errors import (
     PyProjectTOMLValueAlreadySetError,
     PyProjectTOMLValueMissingError,
 )
 from usethis._integrations.pyproject.io import (
+    read_pyproject_dict,
     read_pyproject_toml,
     write_pyproject_toml,
 )
 
+_DICT_ADAPTER = TypeAdapter(dict)
+_LIST_ADAPTER = TypeAdapter(list)
+
 
 def get_config_value(id_keys: list[str]) -> Any:
+    """Get a value from the pyproject.toml configuration file.
+
+    The value may be shared with other reads within an `edit_pyproject_toml` context,
+    so it must not be modified. Use `set_config_value` to make changes.
+    """
     if not id_keys:
         msg = "At least one ID key must be provided."
         raise ValueError(msg)
 
-    pyproject = read_pyproject_toml()
+    pyproject = read_pyproject_dict()
 
     p = pyproject
     for key in id_keys:
-        TypeAdapter(dict).validate_python(p)
+        _DICT_ADAPTER.validate_python(p)
         assert isinstance(p, dict)
         p = p[key]
 
@@ -47,7 +54,7 @@ def set_config_value(
     try:
         p, parent = pyproject, {}
         for key in id_keys:
-            TypeAdapter(dict).validate_python(p)
+            _DICT_ADAPTER.validate_python(p)
             assert isinstance(p, dict)
             p, parent = p[key], p
     except KeyError:
@@ -56,11 +63,7 @@ def set_config_value(
         # above. For example, if there is [tool.ruff] then we shouldn't overwrite it
         # with [tool.deptry]; they should coexist. So under the "tool" key, we need
         # to merge the two dicts.
-        contents = value
-        for key in reversed(id_keys):
-            contents = {key: contents}
-        pyproject = mergedeep.merge(pyproject, contents)
-        assert isinstance(pyproject, TOMLDocument)
+        _set_value_in_missing_keys(pyproject, id_keys, value)
     else:
         if not exists_ok:
             # The configuration is already present, which is not allowed.
@@ -68,13 +71,36 @@ def set_config_value(
             raise PyProjectTOMLValueAlreadySetError(msg)
         else:
             # The configuration is already present, but we're allowed to overwrite it.
-            TypeAdapter(dict).validate_python(parent)
+            _DICT_ADAPTER.validate_python(parent)
             assert isinstance(parent, dict)
             parent[id_keys[-1]] = value
 
     write_pyproject_toml(pyproject)
 
 
+def _set_value_in_missing_keys(
+    pyproject: dict[str, Any], id_keys: list[str], value: Any
+) -> None:
+    """Set a value, creating whichever of the ID keys are missing.
+
+    Only the first missing key is assigned to, so the existing configuration is kept.
+    """
+    p = pyproject
+    for idx, key in enumerate(id_keys[:-1]):
+        if key not in p:
+            contents = value
+            for k in reversed(id_keys[idx + 1 :]):
+                contents = {k: contents}
+            p[key] = contents
+            return
+
+        p = p[key]
+        _DICT_ADAPTER.validate_python(p)
+        assert isinstance(p, dict)
+
+    p[id_keys[-1]] = value
+
+
 def remove_config_value(id_keys: list[str], *, missing_ok: bool = False) -> None:
     if not id_keys:
         msg = "At least one ID key must be provided."
@@ -86,7 +112,7 @@ def remove_config_value(id_keys: list[str], *, missing_ok: bool = False) -> None
     try:
         p = pyproject
         for key in id_keys:
-            TypeAdapter(dict).validate_python(p)
+            _DICT_ADAPTER.validate_python(p)
             assert isinstance(p, dict)
             p = p[key]
     except KeyError:
@@ -101,7 +127,7 @@ def remove_config_value(id_keys: list[str], *, missing_ok: bool = False) -> None
     # Remove the configuration.
     p = pyproject
     for key in id_keys[:-1]:
-        TypeAdapter(dict).validate_python(p)
+        _DICT_ADAPTER.validate_python(p)
         assert isinstance(p, dict)
         p = p[key]
     assert isinstance(p, dict)
@@ -110,11 +136,10 @@ def remove_config_value(id_keys: list[str], *, missing_ok: bool = False) -> None
     # Cleanup: any empty sections should be removed.
     for idx in range(len(id_keys) - 1):
         p, parent = pyproject, {}
-        TypeAdapter(dict).validate_python(p)
+        _DICT_ADAPTER.validate_python(p)
         for key in id_keys[: idx + 1]:
             p, parent = p[key], p
-            TypeAdapter(dict).validate_python(p)
-            TypeAdapter(dict).validate_python(parent)
+            _DICT_ADAPTER.validate_python(p)
             assert isinstance(p, dict)
             assert isinstance(parent, dict)
         assert isinstance(p, dict)
@@ -138,26 +163,19 @@ def append_config_list(
     try:
         p = pyproject
         for key in id_keys[:-1]:
-            TypeAdapter(dict).validate_python(p)
+            _DICT_ADAPTER.validate_python(p)
             assert isinstance(p, dict)
             p = p[key]
         p_parent = p
-        TypeAdapter(dict).validate_python(p_parent)
+        _DICT_ADAPTER.validate_python(p_parent)
         assert isinstance(p_parent, dict)
         p = p_parent[id_keys[-1]]
     except KeyError:
-        contents = values
-        for key in reversed(id_keys):
-            contents = {key: contents}
-        assert isinstance(contents, dict)
-        pyproject = mergedeep.merge(pyproject, contents)
-        assert isinstance(pyproject, TOMLDocument)
+        _set_value_in_missing_keys(pyproject, id_keys, values)
     else:
-        TypeAdapter(dict).validate_python(p_parent)
-        TypeAdapter(list).validate_python(p)
-        assert isinstance(p_parent, dict)
+        _LIST_ADAPTER.validate_python(p)
         assert isinstance(p, list)
-        p_parent[id_keys[-1]] = p + values
+        p.extend(values)
 
     write_pyproject_toml(pyproject)
 
@@ -172,35 +190,42 @@ def remove_from_config_list(id_keys: list[str], values: list[str]) -> None:
     try:
         p = pyproject
         for key in id_keys[:-1]:
-            TypeAdapter(dict).validate_python(p)
+            _DICT_ADAPTER.validate_python(p)
             assert isinstance(p, dict)
             p = p[key]
 
         p_parent = p
-        TypeAdapter(dict).validate_python(p_parent)
+        _DICT_ADAPTER.validate_python(p_parent)
         assert isinstance(p_parent, dict)
         p = p_parent[id_keys[-1]]
     except KeyError:
         # The configuration is not present.
         return
 
-    TypeAdapter(dict).validate_python(p_parent)
-    TypeAdapter(list).validate_python(p)
-    assert isinstance(p_parent, dict)
+    _LIST_ADAPTER.validate_python(p)
     assert isinstance(p, list)
+    # Narrowing from the document type would otherwise only allow deleting by key.
+    config_list = cast(list, p)
+
+    values_set = set(values)
+    idxs = [idx for idx, value in enumerate(config_list) if value in values_set]
+    if not idxs:
+        # Nothing to remove, so there's no need to write the file.
+        return
 
-    new_values = [value for value in p if value not in values]
-    p_parent[id_keys[-1]] = new_values
+    # Delete in-place (last first, so indices stay valid) to keep the list's format.
+    for idx in reversed(idxs):
+        del config_list[idx]
 
     write_pyproject_toml(pyproject)
 
 
 def do_id_keys_exist(id_keys: list[str]) -> bool:
-    pyproject = read_pyproject_toml()
+    pyproject = read_pyproject_dict()
 
     try:
         for key in id_keys:
-            TypeAdapter(dict).validate_python(pyproject)
+            _DICT_ADAPTER.validate_python(pyproject)
             assert isinstance(pyproject, dict)
             pyproject = pyproject[key]
     except KeyError:
@@ -1,8 +1,11 @@
 import tomllib
+from collections.abc import Generator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 
 import tomlkit
+from pydantic import BaseModel, ConfigDict
 
 from usethis._integrations.pyproject.errors import (
     PyProjectTOMLDecodeError,
@@ -10,15 +13,118 @@ from usethis._integrations.pyproject.errors import (
 )
 
 
+class _PyProjectTOMLEditState(BaseModel):
+    """Global-state for batching edits to 'pyproject.toml'.
+
+    Attributes:
+        depth: The number of currently open `edit_pyproject_toml` contexts.
+        document: The document shared by readers and writers while a context is open.
+        content: The plain contents shared by read-only lookups while a context is open.
+        is_dirty: Whether the shared document has changes which aren't on disk yet.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    depth: int = 0
+    document: tomlkit.TOMLDocument | None = None
+    content: dict[str, Any] | None = None
+    is_dirty: bool = False
+
+
+_edit_state = _PyProjectTOMLEditState()
+
+
+@contextmanager
+def edit_pyproject_toml() -> Generator[None, None, None]:
+    """A context manager to batch modifications to 'pyproject.toml'.
+
+    Within the context, every read shares a single parsed document and writes are
+    deferred until the outermost context exits, so the file is parsed and written at
+    most once. If an error is raised out of the outermost context, the deferred changes
+    are discarded rather than written. Contexts can be nested.
+    """
+    _edit_state.depth += 1
+    try:
+        yield
+    except BaseException:
+        if _edit_state.depth == 1:
+            # The shared document may have been left half-modified. Within a nested
+            # context, the error might still be handled by an enclosing context, so
+            # leave it for the outermost one to decide.
+            _discard_pyproject_toml()
+        raise
+    finally:
+        _edit_state.depth -= 1
+
+    if _edit_state.depth == 0:
+        flush_pyproject_toml()
+
+
+def flush_pyproject_toml(*, keep_document: bool = False) -> None:
+    """Write any deferred 'pyproject.toml' changes to disk and forget the document.
+
+    This should be called before handing over to another process which might read or
+    modify 'pyproject.toml', so that the next read within an `edit_pyproject_toml`
+    context sees its changes. If the process won't modify the file, `keep_document`
+    can be set so that the document is still shared after the flush.
+    """
+    document = _edit_state.document
+    is_dirty = _edit_state.is_dirty
+
+    # Reset the state before writing, so a failed write can't leave a stale document
+    # behind for the next context.
+    _edit_state.is_dirty = False
+    if not keep_document:
+        _edit_state.document = None
+        _edit_state.content = None
+
+    if document is not None and is_dirty:
+        _write_pyproject_toml(document)
+
+
+def _discard_pyproject_toml() -> None:
+    """Forget any deferred 'pyproject.toml' changes without writing them."""
+    _edit_state.document = None
+    _edit_state.content = None
+    _edit_state.is_dirty = False
+
+
 def read_pyproject_toml() -> tomlkit.TOMLDocument:
+    if _edit_state.depth > 0 and _edit_state.document is not None:
+        return _edit_state.document
+
     try:
-        return tomlkit.parse((Path.cwd() / "pyproject.toml").read_text())
+        document = tomlkit.parse((Path.cwd() / "pyproject.toml").read_text())
     except FileNotFoundError:
         msg = "'pyproject.toml' not found in the current directory."
         raise PyProjectTOMLNotFoundError(msg)
 
+    if _edit_state.depth > 0:
+        _edit_state.document = document
+
+    return document
+
 
 def read_pyproject_dict() -> dict[str, Any]:
+    """Read the contents of 'pyproject.toml' as plain Python objects.
+
+    Within an `edit_pyproject_toml` context, the contents are shared between calls, so
+    they must not be modified. Use `read_pyproject_toml` to make changes.
+    """
+    if _edit_state.depth == 0:
+        return _read_pyproject_dict()
+
+    if _edit_state.content is None:
+        if _edit_state.is_dirty:
+            # Don't bypass changes which haven't been written to disk yet.
+            _edit_state.content = read_pyproject_toml().unwrap()
+        else:
+            _edit_state.content = _read_pyproject_dict()
+
+    return _edit_state.content
+
+
+def _read_pyproject_dict() -> dict[str, Any]:
     try:
         with Path("pyproject.toml").open("rb") as f:
             try:
@@ -33,4 +139,14 @@ def read_pyproject_dict() -> dict[str, Any]:
 
 
 def write_pyproject_toml(toml_document: tomlkit.TOMLDocument) -> None:
+    if _edit_state.depth > 0:
+        _edit_state.document = toml_document
+        _edit_state.content = None
+        _edit_state.is_dirty = True
+        return
+
+    _write_pyproject_toml(toml_document)
+
+
+def _write_pyproject_toml(toml_document: tomlkit.TOMLDocument) -> None:
     (Path.cwd() / "pyproject.toml").write_text(tomlkit.dumps(toml_document))
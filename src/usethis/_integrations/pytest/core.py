@@ -1,4 +1,3 @@
-import shutil
 from pathlib import Path
 
 from usethis._console import box_print, tick_print
@@ -28,10 +27,11 @@ def remove_pytest_dir() -> None:
         # Early exit; tests directory does not exist
         return
 
-    if set(tests_dir.iterdir()) <= {tests_dir / "conftest.py"}:
+    if all(path.name == "conftest.py" for path in tests_dir.iterdir()):
         # The only file in the directory is conftest.py
         tick_print("Removing '/tests'.")
-        shutil.rmtree(tests_dir)
+        (tests_dir / "conftest.py").unlink(missing_ok=True)
+        tests_dir.rmdir()
     else:
         box_print("Reconfigure the /tests directory to run without pytest.")
         # Note we don't actually remove the directory, just explain what needs to be done.
@@ -1,3 +1,5 @@
+from collections.abc import Iterable
+
 from usethis._console import tick_print
 from usethis._integrations.pyproject.core import (
     append_config_list,
@@ -6,7 +8,7 @@ from usethis._integrations.pyproject.core import (
 )
 
 
-def select_ruff_rules(rules: list[str]) -> None:
+def select_ruff_rules(rules: Iterable[str]) -> None:
     """Add Ruff rules to the project."""
     rules = sorted(set(rules) - set(get_ruff_rules()))
 
@@ -20,7 +22,7 @@ def select_ruff_rules(rules: list[str]) -> None:
     append_config_list(["tool", "ruff", "lint", "select"], rules)
 
 
-def ignore_ruff_rules(rules: list[str]) -> None:
+def ignore_ruff_rules(rules: Iterable[str]) -> None:
     """Ignore Ruff rules in the project."""
     rules = sorted(set(rules) - set(get_ignored_ruff_rules()))
 
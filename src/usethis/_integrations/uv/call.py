@@ -1,13 +1,23 @@
+from usethis._integrations.pyproject.io import flush_pyproject_toml
 from usethis._integrations.uv.errors import UVSubprocessFailedError
 from usethis._subprocess import SubprocessFailedError, call_subprocess
 
 
-def call_uv_subprocess(args: list[str]) -> str:
+def call_uv_subprocess(args: list[str], *, change_toml: bool = True) -> str:
     """Run a subprocess using the uv command-line tool.
 
+    Args:
+        args: The arguments to pass to uv.
+        change_toml: Whether the uv command might modify 'pyproject.toml'. This should
+                     only be False for commands which certainly won't.
+
     Raises:
         UVSubprocessFailedError: If the subprocess fails.
     """
+    # uv may read 'pyproject.toml', so it needs to see any deferred changes. If it
+    # might modify it, later reads need to see those changes too.
+    flush_pyproject_toml(keep_document=not change_toml)
+
     try:
         return call_subprocess(["uv", *args])
     except SubprocessFailedError as err:
@@ -5,13 +5,13 @@ from pydantic import TypeAdapter
 
 from usethis._config import usethis_config
 from usethis._console import tick_print
-from usethis._integrations.pyproject.io import read_pyproject_toml
+from usethis._integrations.pyproject.io import read_pyproject_dict
 from usethis._integrations.uv.call import call_uv_subprocess
 from usethis._integrations.uv.errors import UVDepGroupError, UVSubprocessFailedError
 
 
 def get_dep_groups() -> dict[str, list[str]]:
-    pyproject = read_pyproject_toml()
+    pyproject = read_pyproject_dict()
     try:
         dep_groups_section = pyproject["dependency-groups"]
     except KeyError:
@@ -41,47 +41,49 @@ def add_deps_to_group(pypi_names: list[str], group: str) -> None:
     """Add a package as a non-build dependency using PEP 735 dependency groups."""
     existing_group = get_deps_from_group(group)
 
-    for dep in pypi_names:
-        if _strip_extras(dep) in existing_group:
-            # Early exit; the tool is already a dev dependency.
-            continue
+    # Early exit for deps which are already in the group; the rest are added with a
+    # single uv call, since each call re-resolves and re-syncs the environment.
+    deps = [dep for dep in pypi_names if _strip_extras(dep) not in existing_group]
+    if not deps:
+        return
 
+    for dep in deps:
         tick_print(f"Adding '{dep}' to the '{group}' dependency group.")
-        try:
-            if not usethis_config.offline:
-                call_uv_subprocess(["add", "--group", group, "--quiet", dep])
-            else:
-                call_uv_subprocess(
-                    ["add", "--group", group, "--quiet", "--offline", dep]
-                )
-        except UVSubprocessFailedError as err:
-            msg = f"Failed to add '{dep}' to the '{group}' dependency group:\n{err}"
-            raise UVDepGroupError(msg) from None
+    try:
+        if not usethis_config.offline:
+            call_uv_subprocess(["add", "--group", group, "--quiet", *deps])
+        else:
+            call_uv_subprocess(["add", "--group", group, "--quiet", "--offline", *deps])
+    except UVSubprocessFailedError as err:
+        deps_str = ", ".join([f"'{dep}'" for dep in deps])
+        msg = f"Failed to add {deps_str} to the '{group}' dependency group:\n{err}"
+        raise UVDepGroupError(msg) from None
 
 
 def remove_deps_from_group(pypi_names: list[str], group: str) -> None:
     """Remove the tool's development dependencies, if present."""
     existing_group = get_deps_from_group(group)
 
-    for dep in pypi_names:
-        if _strip_extras(dep) not in existing_group:
-            # Early exit; the tool is already not a dependency.
-            continue
+    # Early exit for deps which are already not in the group; the rest are removed
+    # with a single uv call.
+    deps = [dep for dep in pypi_names if _strip_extras(dep) in existing_group]
+    if not deps:
+        return
 
+    for dep in deps:
         tick_print(f"Removing '{dep}' from the '{group}' dependency group.")
-        se_dep = _strip_extras(dep)
-        try:
-            if not usethis_config.offline:
-                call_uv_subprocess(["remove", "--group", group, "--quiet", se_dep])
-            else:
-                call_uv_subprocess(
-                    ["remove", "--group", group, "--quiet", "--offline", se_dep]
-                )
-        except UVSubprocessFailedError as err:
-            msg = (
-                f"Failed to remove '{dep}' from the '{group}' dependency group:\n{err}"
+    se_deps = [_strip_extras(dep) for dep in deps]
+    try:
+        if not usethis_config.offline:
+            call_uv_subprocess(["remove", "--group", group, "--quiet", *se_deps])
+        else:
+            call_uv_subprocess(
+                ["remove", "--group", group, "--quiet", "--offline", *se_deps]
             )
-            raise UVDepGroupError(msg) from None
+    except UVSubprocessFailedError as err:
+        deps_str = ", ".join([f"'{dep}'" for dep in deps])
+        msg = f"Failed to remove {deps_str} from the '{group}' dependency group:\n{err}"
+        raise UVDepGroupError(msg) from None
 
 
 def is_dep_in_any_group(dep: str) -> bool:
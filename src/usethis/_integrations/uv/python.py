@@ -8,9 +8,13 @@ from usethis._integrations.uv.errors import UVUnparsedPythonVersionError
 
 def get_available_python_versions() -> set[str]:
     if not usethis_config.offline:
-        output = call_uv_subprocess(["python", "list", "--all-versions"])
+        output = call_uv_subprocess(
+            ["python", "list", "--all-versions"], change_toml=False
+        )
     else:
-        output = call_uv_subprocess(["python", "list", "--all-versions", "--offline"])
+        output = call_uv_subprocess(
+            ["python", "list", "--all-versions", "--offline"], change_toml=False
+        )
 
     return {
         _parse_python_version_from_uv_output(version) for version in output.splitlines()
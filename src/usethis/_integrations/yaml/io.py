@@ -3,7 +3,7 @@ from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
 from types import NoneType
-from typing import TypeAlias
+from typing import Any, TypeAlias
 
 import ruamel.yaml
 from ruamel.yaml.comments import (
@@ -62,9 +62,26 @@ class YAMLDocument:
 
     Attributes:
         content: The content of the YAML document as a ruamel.yaml object.
+        write: Whether to write the content back to the file when the edit ends.
     """
 
     content: YAMLLiteral
+    write: bool = True
+
+
+def parse_yaml(text: str, *, yaml_path: Path) -> Any:
+    """Parse the contents of a YAML file which were read from `yaml_path`.
+
+    This uses the faster "safe" loader, which discards round-trip information such as
+    comments, so it is only suitable for reading. Use `edit_yaml` to make changes.
+    """
+    yaml = ruamel.yaml.YAML(typ="safe")
+
+    try:
+        return yaml.load(text)
+    except YAMLError as err:
+        msg = f"Error reading '{yaml_path}':\n{err}"
+        raise InvalidYAMLError(msg) from None
 
 
 @contextmanager
@@ -76,8 +93,8 @@ def edit_yaml(
     """A context manager to modify a YAML file in-place, with managed read and write."""
 
     with yaml_path.open(mode="r") as f:
-        # Can't preserve quotes so don't keep the content.
-        # Yes, it' not very efficient to load the content twice.
+        # This is the only parse of the file: the indentation is guessed with a
+        # line-by-line scan of the same text before it is loaded.
         try:
             content, sequence_ind, offset_ind = load_yaml_guess_indent(f)
         except YAMLError as err:
@@ -99,4 +116,5 @@ def edit_yaml(
     yaml_document = YAMLDocument(content=content)
     yield yaml_document
 
-    yaml.dump(yaml_document.content, yaml_path)
+    if yaml_document.write:
+        yaml.dump(yaml_document.content, yaml_path)
@@ -1,12 +1,6 @@
 import typer
 
 from usethis._config import offline_opt, quiet_opt, usethis_config
-from usethis._core.badge import (
-    add_pre_commit_badge,
-    add_ruff_badge,
-    remove_pre_commit_badge,
-    remove_ruff_badge,
-)
 
 app = typer.Typer(help="Add badges to the top of the README.md file.")
 
@@ -21,6 +15,8 @@ def ruff(
     offline: bool = offline_opt,
     quiet: bool = quiet_opt,
 ) -> None:
+    from usethis._core.badge import add_ruff_badge, remove_ruff_badge
+
     if not remove:
         with usethis_config.set(offline=offline, quiet=quiet):
             add_ruff_badge()
@@ -34,6 +30,8 @@ def pre_commit(
     offline: bool = offline_opt,
     quiet: bool = quiet_opt,
 ) -> None:
+    from usethis._core.badge import add_pre_commit_badge, remove_pre_commit_badge
+
     if not remove:
         with usethis_config.set(offline=offline, quiet=quiet):
             add_pre_commit_badge()
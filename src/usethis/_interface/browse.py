@@ -1,7 +1,6 @@
 import typer
 
 from usethis._config import offline_opt, quiet_opt, usethis_config
-from usethis._core.browse import browse_pypi
 
 app = typer.Typer(help="Visit important project-related web pages.")
 
@@ -16,5 +15,7 @@ def pypi(
     offline: bool = offline_opt,
     quiet: bool = quiet_opt,
 ) -> None:
+    from usethis._core.browse import browse_pypi
+
     with usethis_config.set(offline=offline, quiet=quiet):
         browse_pypi(package=package, browser=browser)
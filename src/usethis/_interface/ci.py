@@ -4,7 +4,6 @@ import typer
 
 from usethis._config import offline_opt, quiet_opt, usethis_config
 from usethis._console import err_print, info_print
-from usethis._core.ci import use_ci_bitbucket
 from usethis.errors import UsethisError
 
 app = typer.Typer(help="Add config for Continuous Integration (CI) pipelines.")
@@ -18,6 +17,8 @@ def bitbucket(
     offline: bool = offline_opt,
     quiet: bool = quiet_opt,
 ) -> None:
+    from usethis._core.ci import use_ci_bitbucket
+
     try:
         with usethis_config.set(offline=offline, quiet=quiet):
             use_ci_bitbucket(remove=remove)
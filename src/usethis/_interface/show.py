@@ -1,7 +1,6 @@
 import typer
 
 from usethis._config import offline_opt, quiet_opt, usethis_config
-from usethis._core.show import show_name
 
 app = typer.Typer(help="Show information about the current project.")
 
@@ -11,5 +10,7 @@ def name(
     offline: bool = offline_opt,
     quiet: bool = quiet_opt,
 ) -> None:
+    from usethis._core.show import show_name
+
     with usethis_config.set(offline=offline, quiet=quiet):
         show_name()
@@ -5,13 +5,6 @@ import typer
 
 from usethis._config import offline_opt, quiet_opt, usethis_config
 from usethis._console import err_print
-from usethis._core.tool import (
-    use_deptry,
-    use_pre_commit,
-    use_pyproject_fmt,
-    use_pytest,
-    use_ruff,
-)
 from usethis.errors import UsethisError
 
 app = typer.Typer(help="Add and configure development tools, e.g. linters.")
@@ -27,6 +20,8 @@ remove_opt = typer.Option(
 def deptry(
     remove: bool = remove_opt, offline: bool = offline_opt, quiet: bool = quiet_opt
 ) -> None:
+    from usethis._core.tool import use_deptry
+
     with usethis_config.set(offline=offline, quiet=quiet):
         _run_tool(use_deptry, remove=remove)
 
@@ -37,6 +32,8 @@ def deptry(
 def pre_commit(
     remove: bool = remove_opt, offline: bool = offline_opt, quiet: bool = quiet_opt
 ) -> None:
+    from usethis._core.tool import use_pre_commit
+
     with usethis_config.set(offline=offline, quiet=quiet):
         _run_tool(use_pre_commit, remove=remove)
 
@@ -47,6 +44,8 @@ def pre_commit(
 def pyproject_fmt(
     remove: bool = remove_opt, offline: bool = offline_opt, quiet: bool = quiet_opt
 ) -> None:
+    from usethis._core.tool import use_pyproject_fmt
+
     with usethis_config.set(offline=offline, quiet=quiet):
         _run_tool(use_pyproject_fmt, remove=remove)
 
@@ -55,6 +54,8 @@ def pyproject_fmt(
 def pytest(
     remove: bool = remove_opt, offline: bool = offline_opt, quiet: bool = quiet_opt
 ) -> None:
+    from usethis._core.tool import use_pytest
+
     with usethis_config.set(offline=offline, quiet=quiet):
         _run_tool(use_pytest, remove=remove)
 
@@ -63,6 +64,8 @@ def pytest(
 def ruff(
     remove: bool = remove_opt, offline: bool = offline_opt, quiet: bool = quiet_opt
 ) -> None:
+    from usethis._core.tool import use_ruff
+
     with usethis_config.set(offline=offline, quiet=quiet):
         _run_tool(use_ruff, remove=remove)
 
@@ -1,6 +1,6 @@
 import contextlib
-from functools import reduce, singledispatch, singledispatchmethod
-from typing import assert_never
+from functools import singledispatch
+from typing import TypeAlias, assert_never
 
 from pydantic import BaseModel
 
@@ -9,7 +9,6 @@ from usethis._pipeweld.containers import (
     Parallel,
     Series,
     depgroup,
-    parallel,
     series,
 )
 from usethis._pipeweld.ops import InsertParallel, InsertSuccessor, Instruction
@@ -17,6 +16,12 @@ from usethis._pipeweld.result import WeldResult
 
 
 class Partition(BaseModel):
+    """The components of a pipeline, split by their dependency on the step being added.
+
+    These are only ever built from already-validated components, so they are
+    constructed with `model_construct` to skip re-validating the whole pipeline.
+    """
+
     prerequisite_component: str | Series | DepGroup | Parallel | None = None
     nondependent_component: str | Series | DepGroup | Parallel | None = None
     postrequisite_component: str | Series | DepGroup | Parallel | None = None
@@ -42,7 +47,12 @@ class Adder(BaseModel):
             self.pipeline, predecessor=None
         )
         rearranged_pipeline = _flatten_partition(partition)
-        new_instructions = self._insert_step(rearranged_pipeline)
+        # Partitioning puts every pre-requisite into the leading prerequisite component
+        # of the rearranged pipeline, so there's no need to search the rest of it.
+        new_instructions = self._insert_step(
+            rearranged_pipeline,
+            end=_get_concat_len(partition.prerequisite_component),
+        )
 
         if not new_instructions:
             # Didn't find a pre-requisite so just add the step in parallel to everything
@@ -57,34 +67,42 @@ class Adder(BaseModel):
             instructions=instructions,
         )
 
-    @singledispatchmethod
     def partition_component(
         self, component: str | Series | Parallel | DepGroup, *, predecessor: str | None
     ) -> tuple[Partition, list[Instruction]]:
-        raise NotImplementedError
+        # N.B. this is called for every node in the pipeline, so it dispatches directly
+        # rather than via singledispatchmethod, which rebuilds its wrapper per call.
+        if isinstance(component, str):
+            return self._partition_str(component, predecessor=predecessor)
+        elif isinstance(component, Series):
+            return self._partition_series(component, predecessor=predecessor)
+        elif isinstance(component, Parallel):
+            return self._partition_parallel(component, predecessor=predecessor)
+        elif isinstance(component, DepGroup):
+            return self._partition_depgroup(component, predecessor=predecessor)
+        else:
+            assert_never(component)
 
-    @partition_component.register(str)
-    def _(
+    def _partition_str(
         self, component: str, *, predecessor: str | None
     ) -> tuple[Partition, list[Instruction]]:
         if component in self.prerequisites:
-            return Partition(
+            return Partition.model_construct(
                 prerequisite_component=component,
                 top_ranked_endpoint=component,
             ), []
         elif component in self.postrequisites:
-            return Partition(
+            return Partition.model_construct(
                 postrequisite_component=component,
                 top_ranked_endpoint=component,
             ), []
         else:
-            return Partition(
+            return Partition.model_construct(
                 nondependent_component=component,
                 top_ranked_endpoint=component,
             ), []
 
-    @partition_component.register(Series)
-    def _(
+    def _partition_series(
         self, component: Series, *, predecessor: str | None
     ) -> tuple[Partition, list[Instruction]]:
         partitions: list[Partition] = []
@@ -99,10 +117,10 @@ class Adder(BaseModel):
             predecessor = partition.top_ranked_endpoint  # For the next iteration
 
         if len(partitions) > 1:
-            return reduce(_op_series_merge_partitions, partitions), instructions
+            return _series_merge_partitions(partitions), instructions
         else:
             partition = partitions[0]
-            return Partition(
+            return Partition.model_construct(
                 prerequisite_component=series(partition.prerequisite_component)
                 if partition.prerequisite_component is not None
                 else None,
@@ -115,8 +133,7 @@ class Adder(BaseModel):
                 top_ranked_endpoint=partition.top_ranked_endpoint,
             ), instructions
 
-    @partition_component.register(Parallel)
-    def _(
+    def _partition_parallel(
         self, component: Parallel, *, predecessor: str | None
     ) -> tuple[Partition, list[Instruction]]:
         partition_with_instruction_tuples = [
@@ -140,30 +157,29 @@ class Adder(BaseModel):
         if any_prerequisites and any_postrequisites:
             return _parallel_merge_partitions(*partitions, predecessor=predecessor)
         elif any_prerequisites:
-            return Partition(
+            return Partition.model_construct(
                 prerequisite_component=component,
                 top_ranked_endpoint=min(p.top_ranked_endpoint for p in partitions),
             ), instructions
         elif any_postrequisites:
-            return Partition(
+            return Partition.model_construct(
                 postrequisite_component=component,
                 top_ranked_endpoint=min(p.top_ranked_endpoint for p in partitions),
             ), instructions
         else:
-            return Partition(
+            return Partition.model_construct(
                 nondependent_component=component,
                 top_ranked_endpoint=min(p.top_ranked_endpoint for p in partitions),
             ), instructions
 
-    @partition_component.register(DepGroup)
-    def _(
+    def _partition_depgroup(
         self, component: DepGroup, *, predecessor: str | None
     ) -> tuple[Partition, list[Instruction]]:
         partition, instructions = self.partition_component(
             component.series,
             predecessor=predecessor,
         )
-        partition = Partition(
+        partition = Partition.model_construct(
             prerequisite_component=depgroup(
                 partition.prerequisite_component, config_group=component.config_group
             )
@@ -186,12 +202,19 @@ class Adder(BaseModel):
     def _insert_step(
         self,
         component: Series,
+        *,
+        end: int | None = None,
     ) -> list[Instruction]:
         # Iterate through the pipeline and insert the step
         # Work backwards until we find a pre-requisite (which is the final one), and then
         # insert after it - in parallel to its successor (or append if no successor). If we
         # don't find any pre-requsite then we insert in parallel to everything.
-        for idx, subcomponent in reversed(list(enumerate(component.root))):
+        # Only the components before `end` are searched.
+        root = component.root
+        if end is None:
+            end = len(root)
+        for idx in reversed(range(end)):
+            subcomponent = root[idx]
             if isinstance(subcomponent, str):
                 if subcomponent in self.prerequisites:
                     return self._insert_before_postrequisites(
@@ -284,6 +307,16 @@ def _has_any_steps(
         assert_never(component)
 
 
+def _get_concat_len(component: str | Series | DepGroup | Parallel | None) -> int:
+    """The number of components which `component` contributes to a `_concat` result."""
+    if component is None:
+        return 0
+    elif isinstance(component, Series):
+        return len(component.root)
+    else:
+        return 1
+
+
 def _flatten_partition(partition: Partition) -> Series:
     component = _concat(
         partition.prerequisite_component,
@@ -296,105 +329,138 @@ def _flatten_partition(partition: Partition) -> Series:
     return component
 
 
-def _op_series_merge_partitions(
-    partition: Partition, next_partition: Partition
-) -> Partition:
-    if next_partition.prerequisite_component is not None:
-        return Partition(
+_Accumulated: TypeAlias = (
+    str | Series | DepGroup | Parallel | list[str | Series | DepGroup | Parallel] | None
+)
+
+
+def _series_merge_partitions(partitions: list[Partition]) -> Partition:
+    """Merge the partitions of consecutive components in a series.
+
+    The partitions are merged from left to right. The concatenated components are
+    accumulated in lists and only built into a `Series` at the end, rather than
+    building a new `Series` for every pair of partitions.
+    """
+    first, *rest = partitions
+    prerequisite_component: _Accumulated = first.prerequisite_component
+    nondependent_component: _Accumulated = first.nondependent_component
+    postrequisite_component: _Accumulated = first.postrequisite_component
+    top_ranked_endpoint = first.top_ranked_endpoint
+
+    for next_partition in rest:
+        if next_partition.prerequisite_component is not None:
             # N.B. this concat will never be singleton since at least one of the LHS
-            # partitions will have a non-None prerequisite_component, and this branch of
-            # the if-else will only be taken if the next_partition has a non-None
+            # partitions will have a non-None prerequisite_component, and this branch
+            # of the if-else will only be taken if the next_partition has a non-None
             # prerequisite_component too.
-            prerequisite_component=_concat(
-                partition.prerequisite_component,
-                partition.nondependent_component,
-                partition.postrequisite_component,
+            prerequisite_component = _accumulate_concat(
+                prerequisite_component,
+                nondependent_component,
+                postrequisite_component,
                 next_partition.prerequisite_component,
-            ),
-            nondependent_component=next_partition.nondependent_component,
-            postrequisite_component=next_partition.postrequisite_component,
-            top_ranked_endpoint=next_partition.top_ranked_endpoint,
-        )
-    elif (
-        next_partition.nondependent_component is not None
-        and partition.postrequisite_component is not None
-    ):
-        if partition.prerequisite_component is not None:
-            prerequisite_component = partition.prerequisite_component
-        else:
-            prerequisite_component = None
-
-        return Partition(
-            prerequisite_component=prerequisite_component,
-            nondependent_component=partition.nondependent_component,
-            postrequisite_component=_concat(
-                partition.postrequisite_component,
+            )
+            nondependent_component = next_partition.nondependent_component
+            postrequisite_component = next_partition.postrequisite_component
+        elif (
+            next_partition.nondependent_component is not None
+            and postrequisite_component is not None
+        ):
+            postrequisite_component = _accumulate_concat(
+                postrequisite_component,
                 next_partition.nondependent_component,
                 next_partition.postrequisite_component,
-            ),
-            top_ranked_endpoint=next_partition.top_ranked_endpoint,
-        )
-    else:
-        # Element-wise concatenation
-        if partition.prerequisite_component is None:
-            prerequisite_component = next_partition.prerequisite_component
+            )
         else:
-            prerequisite_component = partition.prerequisite_component
+            # Element-wise concatenation; N.B. the next prerequisite_component is None
+            if nondependent_component is None:
+                nondependent_component = next_partition.nondependent_component
+            elif next_partition.nondependent_component is not None:
+                nondependent_component = _accumulate_concat(
+                    nondependent_component, next_partition.nondependent_component
+                )
+
+            if postrequisite_component is None:
+                postrequisite_component = next_partition.postrequisite_component
+            else:
+                postrequisite_component = _accumulate_concat(
+                    postrequisite_component, next_partition.postrequisite_component
+                )
 
-        if partition.nondependent_component is None:
-            nondependent_component = next_partition.nondependent_component
-        elif next_partition.nondependent_component is None:
-            nondependent_component = partition.nondependent_component
-        else:
-            nondependent_component = _concat(
-                partition.nondependent_component, next_partition.nondependent_component
-            )
+        top_ranked_endpoint = next_partition.top_ranked_endpoint
 
-        if partition.postrequisite_component is None:
-            postrequisite_component = next_partition.postrequisite_component
+    return Partition.model_construct(
+        prerequisite_component=_build_accumulated(prerequisite_component),
+        nondependent_component=_build_accumulated(nondependent_component),
+        postrequisite_component=_build_accumulated(postrequisite_component),
+        top_ranked_endpoint=top_ranked_endpoint,
+    )
+
+
+def _accumulate_concat(
+    *components: _Accumulated,
+) -> list[str | Series | DepGroup | Parallel]:
+    """Concatenate components like `_concat`, but into a list.
+
+    A list from a previous call is extended in-place rather than copied.
+    """
+    first, *rest = components
+    if isinstance(first, list):
+        s = first
+    else:
+        s = []
+        rest = components
+
+    for component in rest:
+        if isinstance(component, list):
+            s.extend(component)
+        elif isinstance(component, Series):
+            s.extend(component.root)
+        elif isinstance(component, Parallel | DepGroup | str):
+            s.append(component)
+        elif component is None:
+            pass
         else:
-            postrequisite_component = _concat(
-                partition.postrequisite_component,
-                next_partition.postrequisite_component,
-            )
+            assert_never(component)
 
-        return Partition(
-            prerequisite_component=prerequisite_component,
-            nondependent_component=nondependent_component,
-            postrequisite_component=postrequisite_component,
-            top_ranked_endpoint=next_partition.top_ranked_endpoint,
-        )
+    return s
+
+
+def _build_accumulated(
+    component: _Accumulated,
+) -> str | Series | DepGroup | Parallel | None:
+    if isinstance(component, list):
+        if not component:
+            return None
+        # The components are already validated, so skip re-validating them all.
+        return Series.model_construct(component)
+    return component
 
 
 def _parallel_merge_partitions(
     *partitions: Partition, predecessor: str | None
 ) -> tuple[Partition, list[Instruction]]:
-    # Element-wise parallelism
-    prerequisite_component = _collapsed_union(
-        *[p.prerequisite_component for p in partitions]
-    )
-    nondependent_component = _collapsed_union(
-        *[p.nondependent_component for p in partitions]
-    )
-    postrequisite_component = _collapsed_union(
-        *[p.postrequisite_component for p in partitions]
-    )
+    # Element-wise parallelism, gathered in a single pass over the partitions
+    prerequisite_components = []
+    nondependent_components = []
+    postrequisite_components = []
+    top_ranked_prerequisite_endpoints = []
+    top_ranked_nondependent_endpoints = []
+    top_ranked_postrequisite_endpoints = []
+    for p in partitions:
+        if p.prerequisite_component is not None:
+            prerequisite_components.append(p.prerequisite_component)
+            top_ranked_prerequisite_endpoints.append(p.top_ranked_endpoint)
+        if p.nondependent_component is not None:
+            nondependent_components.append(p.nondependent_component)
+            top_ranked_nondependent_endpoints.append(p.top_ranked_endpoint)
+        if p.postrequisite_component is not None:
+            postrequisite_components.append(p.postrequisite_component)
+            top_ranked_postrequisite_endpoints.append(p.top_ranked_endpoint)
+
+    prerequisite_component = _collapsed_union(*prerequisite_components)
+    nondependent_component = _collapsed_union(*nondependent_components)
+    postrequisite_component = _collapsed_union(*postrequisite_components)
 
-    top_ranked_prerequisite_endpoints = [
-        p.top_ranked_endpoint
-        for p in partitions
-        if p.prerequisite_component is not None
-    ]
-    top_ranked_nondependent_endpoints = [
-        p.top_ranked_endpoint
-        for p in partitions
-        if p.nondependent_component is not None
-    ]
-    top_ranked_postrequisite_endpoints = [
-        p.top_ranked_endpoint
-        for p in partitions
-        if p.postrequisite_component is not None
-    ]
     top_ranked_endpoint = min(
         top_ranked_postrequisite_endpoints
         or top_ranked_nondependent_endpoints
@@ -428,7 +494,7 @@ def _parallel_merge_partitions(
         )
         instructions.extend(new_instructions)
 
-    return Partition(
+    return Partition.model_construct(
         prerequisite_component=prerequisite_component,
         nondependent_component=nondependent_component,
         postrequisite_component=postrequisite_component,
@@ -545,7 +611,8 @@ def _concat(*components: str | Series | DepGroup | Parallel | None) -> Series |
     if not s:
         return None
 
-    return series(*s)
+    # The components are already validated, so skip re-validating them all.
+    return Series.model_construct(s)
 
 
 def _union(*components: str | Series | DepGroup | Parallel | None) -> Parallel | None:
@@ -565,7 +632,8 @@ def _union(*components: str | Series | DepGroup | Parallel | None) -> Parallel |
     if not p:
         return None
 
-    return parallel(*p)
+    # The components are already validated, so skip re-validating them all.
+    return Parallel.model_construct(frozenset(p))
 
 
 def get_endpoint(component: str | Series | DepGroup | Parallel) -> str:
@@ -590,7 +658,7 @@ def get_endpoint(component: str | Series | DepGroup | Parallel) -> str:
         if not endpoints:
             msg = """No endpoints are defined for a Parallel block with no steps"""
             raise ValueError(msg)
-        return sorted(endpoints)[0]
+        return min(endpoints)
     elif isinstance(component, DepGroup):
         return get_endpoint(component.series)
     else:
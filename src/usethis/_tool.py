@@ -73,19 +73,18 @@ class Tool(Protocol):
         1. Whether any of the tool's characteristic dev dependencies are in the project.
         2. Whether any of the tool's managed files are in the project.
         3. Whether any of the tool's managed pyproject.toml sections are present.
+
+        The heuristics are checked in order, stopping as soon as one is satisfied.
         """
-        is_any_deps = any(
-            is_dep_in_any_group(dep) for dep in self.get_unique_dev_deps()
-        )
-        is_any_files = any(
-            file.exists() and file.is_file() for file in self.get_managed_files()
-        )
-        is_any_pyproject = any(
-            do_id_keys_exist(id_keys) for id_keys in self.get_pyproject_id_keys()
+        return (
+            any(is_dep_in_any_group(dep) for dep in self.get_unique_dev_deps())
+            # N.B. is_file() is False for missing files, so no separate exists() check
+            or any(file.is_file() for file in self.get_managed_files())
+            or any(
+                do_id_keys_exist(id_keys) for id_keys in self.get_pyproject_id_keys()
+            )
         )
 
-        return is_any_deps or is_any_files or is_any_pyproject
-
     def add_pre_commit_repo_configs(self) -> None:
         """Add the tool's pre-commit configuration."""
         repos = self.get_pre_commit_repos()
@@ -5,6 +5,7 @@ import pytest
 from usethis._integrations.bitbucket.io import (
     BitbucketPipelinesYAMLConfigError,
     edit_bitbucket_pipelines_yaml,
+    read_bitbucket_pipelines_yaml,
 )
 from usethis._test import change_cwd
 
@@ -45,6 +46,27 @@ image: atlassian/default-image:3
             contents
             == """\
 image: atlassian/default-image:3
+"""
+        )
+
+    def test_unchanged_not_rewritten(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "bitbucket-pipelines.yml").write_text(
+            """\
+image:    atlassian/default-image:3
+"""
+        )
+
+        # Act
+        with change_cwd(tmp_path), edit_bitbucket_pipelines_yaml() as _:
+            pass
+
+        # Assert
+        contents = (tmp_path / "bitbucket-pipelines.yml").read_text()
+        assert (
+            contents
+            == """\
+image:    atlassian/default-image:3
 """
         )
 
@@ -147,3 +169,53 @@ awfpah28yqh2an ran  2rqa0-2 }[
             edit_bitbucket_pipelines_yaml() as _,
         ):
             pass
+
+
+class TestReadBitbucketPipelinesYAML:
+    def test_unchanged_file_is_cached(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "bitbucket-pipelines.yml").write_text(
+            """\
+image: atlassian/default-image:3
+"""
+        )
+
+        # Act
+        with change_cwd(tmp_path):
+            model1 = read_bitbucket_pipelines_yaml()
+            model2 = read_bitbucket_pipelines_yaml()
+
+        # Assert
+        assert model1 is model2
+
+    def test_sees_edits(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "bitbucket-pipelines.yml").write_text(
+            """\
+image: atlassian/default-image:3
+"""
+        )
+
+        # Act
+        with change_cwd(tmp_path):
+            read_bitbucket_pipelines_yaml()
+            with edit_bitbucket_pipelines_yaml() as doc:
+                assert isinstance(doc.content, dict)  # Help pyright
+                doc.content["image"] = "atlassian/default-image:2"
+            model = read_bitbucket_pipelines_yaml()
+
+        # Assert
+        assert model.model_dump()["image"] == "atlassian/default-image:2"
+
+    def test_invalid_contents(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "bitbucket-pipelines.yml").write_text("""\
+awfpah28yqh2an ran  2rqa0-2 }[
+""")
+
+        # Act, Assert
+        with (
+            change_cwd(tmp_path),
+            pytest.raises(BitbucketPipelinesYAMLConfigError),
+        ):
+            read_bitbucket_pipelines_yaml()
@@ -1,5 +1,4 @@
 from pathlib import Path
-from uuid import UUID
 
 import pytest
 
@@ -77,6 +76,31 @@ pipelines:
                 new_step=Step(name="foo", script=Script(["echo foo"])),
             )
 
+    def test_instruction_for_other_step(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "bitbucket-pipelines.yml").write_text(
+            """\
+image: atlassian/default-image:3
+pipelines:
+    default:
+      - step:
+            name: bar
+            script:
+              - echo bar
+"""
+        )
+
+        # Act
+        with change_cwd(tmp_path):
+            apply_pipeweld_instruction(
+                InsertSuccessor(step="baz", after="bar"),
+                new_step=Step(name="foo", script=Script(["echo foo"])),
+            )
+
+        # Assert
+        content = (tmp_path / "bitbucket-pipelines.yml").read_text()
+        assert "foo" not in content
+
     def test_existing_pipeline(self, tmp_path: Path):
         # Arrange
         (tmp_path / "bitbucket-pipelines.yml").write_text(
@@ -663,9 +687,7 @@ class TestGetPipeweldPipelineFromDefault:
                 config_group=dg.config_group,
             )
         )
-        assert dg.config_group.startswith("Unnamed Stage ")
-        uuid = dg.config_group.removeprefix("Unnamed Stage ")
-        UUID(uuid)  # Raises no error
+        assert dg.config_group == "Unnamed Stage 0"
 
 
 class TestGetPipeweldStep:
@@ -694,3 +716,18 @@ class TestGetPipeweldStep:
 
         # Assert
         assert result == "foo"
+
+    def test_no_name_after_modification(self):
+        # Arrange
+        step = Step(
+            name=None,
+            script=Script(["echo foo"]),
+        )
+        get_pipeweld_step(step)
+
+        # Act
+        step.script = Script(["echo bar"])
+        result = get_pipeweld_step(step)
+
+        # Assert
+        assert result == """{"script":["echo bar"]}"""
@@ -2,8 +2,22 @@ from pathlib import Path
 
 import pytest
 import requests
+from pydantic import ValidationError
 
-from usethis._integrations.bitbucket.schema import Script, Step, Step2, StepBase
+from usethis._integrations.bitbucket.anchor import ScriptItemAnchor
+from usethis._integrations.bitbucket.schema import (
+    Items,
+    ParallelExpanded,
+    ParallelItem,
+    Pipe,
+    PipelinesConfiguration,
+    Script,
+    StageItem,
+    Step,
+    Step2,
+    StepBase,
+    StepItem,
+)
 from usethis._test import is_offline
 
 
@@ -16,6 +30,51 @@ class TestStep2:
         assert set(Step2.model_fields.keys()) == set(Step.model_fields.keys())
 
 
+class TestDiscriminatedUnions:
+    def test_items_by_key(self):
+        # Act
+        items = Items.model_validate(
+            [
+                {"step": {"script": ["a"]}},
+                {"parallel": {"steps": [{"step": {"script": ["b"]}}]}},
+                {"stage": {"steps": [{"step": {"script": ["c"]}}]}},
+            ]
+        )
+
+        # Assert
+        assert [type(item) for item in items.root] == [
+            StepItem,
+            ParallelItem,
+            StageItem,
+        ]
+
+    def test_parallel_by_shape(self):
+        # Act
+        items = Items.model_validate(
+            [{"parallel": {"fail-fast": True, "steps": [{"step": {"script": ["a"]}}]}}]
+        )
+
+        # Assert
+        (item,) = items.root
+        assert isinstance(item, ParallelItem)
+        assert isinstance(item.parallel.root, ParallelExpanded)
+
+    def test_script_items(self):
+        # Act
+        script = Script.model_validate(
+            ["echo hi", {"pipe": "atlassian/demo:1.0.0"}, {"name": "install-uv"}]
+        )
+
+        # Assert
+        assert [type(item) for item in script.root] == [str, Pipe, ScriptItemAnchor]
+
+    def test_unknown_item_invalid(self):
+        with pytest.raises(ValidationError, match="union_tag_not_found"):
+            PipelinesConfiguration.model_validate(
+                {"pipelines": {"default": [{"foo": "bar"}]}}
+            )
+
+
 class TestSchemaJSON:
     def test_matches_schema_store(self):
         if is_offline():
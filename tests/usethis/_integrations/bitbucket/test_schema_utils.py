@@ -0,0 +1,27 @@
+from usethis._integrations.bitbucket.schema import Script, Step, Step1
+from usethis._integrations.bitbucket.schema_utils import step1tostep
+
+
+class TestStep1ToStep:
+    def test_basic(self):
+        # Arrange
+        step1 = Step1.model_validate({"step": {"name": "Build", "script": ["make"]}})
+
+        # Act
+        step = step1tostep(step1)
+
+        # Assert
+        assert step == Step(name="Build", script=Script(["make"]))
+
+    def test_aliased_fields_kept(self):
+        # Arrange
+        step1 = Step1.model_validate(
+            {"step": {"script": ["make"], "after-script": ["echo done"], "max-time": 5}}
+        )
+
+        # Act
+        step = step1tostep(step1)
+
+        # Assert
+        assert step.after_script == Script(["echo done"])
+        assert step.max_time == 5
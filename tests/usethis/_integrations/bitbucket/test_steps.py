@@ -22,6 +22,7 @@ from usethis._integrations.bitbucket.steps import (
     Step,
     UnexpectedImportPipelineError,
     _add_step_caches_via_doc,
+    _steps_are_equivalent,
     add_placeholder_step_in_default,
     add_step_in_default,
     get_defined_script_items_via_doc,
@@ -202,6 +203,28 @@ pipelines:
                 item_by_name = get_defined_script_items_via_doc(doc=doc)
                 assert len(item_by_name) == 1
 
+    def test_same_script_step_anchor_twice_in_one_step(self, tmp_path: Path):
+        # Arrange
+        step = Step(
+            name="Greeting",
+            script=Script(
+                [
+                    ScriptItemAnchor(name="install-uv"),
+                    "echo 'Hello, world!'",
+                    ScriptItemAnchor(name="install-uv"),
+                ]
+            ),
+        )
+
+        with change_cwd(tmp_path):
+            # Act
+            add_step_in_default(step)
+
+            # Assert
+            contents = (tmp_path / "bitbucket-pipelines.yml").read_text()
+            assert contents.count("&install-uv") == 1
+            assert contents.count("*install-uv") == 2
+
     def test_order(self, uv_init_dir: Path, capfd: pytest.CaptureFixture[str]):
         # Act
         with change_cwd(uv_init_dir):
@@ -246,6 +269,51 @@ pipelines:
             "✔ Adding 'Run pre-commit' to default pipeline in 'bitbucket-pipelines.yml'.\n"
         )
 
+    def test_test_steps_ordered_by_version(self, tmp_path: Path):
+        # Act
+        with change_cwd(tmp_path):
+            add_step_in_default(
+                Step(
+                    name="Test on 3.13",
+                    script=Script(["echo 'Running #3'"]),
+                ),
+            )
+            add_step_in_default(
+                Step(
+                    name="Test on 3.9",
+                    script=Script(["echo 'Running #1'"]),
+                ),
+            )
+            add_step_in_default(
+                Step(
+                    name="Test on 3.12",
+                    script=Script(["echo 'Running #2'"]),
+                ),
+            )
+
+        # Assert
+        contents = (tmp_path / "bitbucket-pipelines.yml").read_text()
+        assert (
+            contents
+            == """\
+image: atlassian/default-image:3
+pipelines:
+    default:
+      - step:
+            name: Test on 3.9
+            script:
+              - "echo 'Running #1'"
+      - step:
+            name: Test on 3.12
+            script:
+              - "echo 'Running #2'"
+      - step:
+            name: Test on 3.13
+            script:
+              - "echo 'Running #3'"
+"""
+        )
+
     def test_placeholder_removed(
         self, uv_init_dir: Path, capfd: pytest.CaptureFixture[str]
     ):
@@ -1128,3 +1196,51 @@ image: atlassian/default-image:3
                 ),
                 doc=doc,
             )
+
+
+class TestStepsAreEquivalent:
+    def test_none(self):
+        # Arrange
+        step = Step(name="Greeting", script=Script(["echo 'Hello, world!'"]))
+
+        # Act, Assert
+        assert not _steps_are_equivalent(None, step)
+
+    def test_same_name(self):
+        # Arrange
+        step1 = Step(name="Greeting", script=Script(["echo 'Hello, world!'"]))
+        step2 = Step(name="Greeting", script=Script(["echo 'Goodbye!'"]))
+
+        # Act, Assert
+        assert _steps_are_equivalent(step1, step2)
+
+    def test_same_contents_different_name(self):
+        # Arrange
+        step1 = Step(name="Greeting", script=Script(["echo 'Hello, world!'"]))
+        step2 = Step(name="Salutation", script=Script(["echo 'Hello, world!'"]))
+
+        # Act, Assert
+        assert _steps_are_equivalent(step1, step2)
+
+    def test_different_contents_different_name(self):
+        # Arrange
+        step1 = Step(name="Greeting", script=Script(["echo 'Hello, world!'"]))
+        step2 = Step(
+            name="Salutation",
+            script=Script(["echo 'Hello, world!'"]),
+            caches=["uv"],
+        )
+
+        # Act, Assert
+        assert not _steps_are_equivalent(step1, step2)
+
+    def test_name_not_modified(self):
+        # Arrange
+        step1 = Step(name="Greeting", script=Script(["echo 'Hello, world!'"]))
+        step2 = Step(name="Salutation", script=Script(["echo 'Hello, world!'"]))
+
+        # Act
+        _steps_are_equivalent(step1, step2)
+
+        # Assert
+        assert step1.name == "Greeting"
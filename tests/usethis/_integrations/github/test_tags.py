@@ -1,3 +1,7 @@
+import json
+from pathlib import Path
+from typing import ClassVar
+
 import pytest
 import requests
 
@@ -8,10 +12,20 @@ from usethis._integrations.github.tags import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _tmp_cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        "usethis._integrations.github.tags._get_cache_dir", lambda: tmp_path
+    )
+
+
 class TestGetGitHubLatestTag:
     def test_mock(self, monkeypatch: pytest.MonkeyPatch):
         def mock_get(*args, **kwargs):
             class MockResponse:
+                status_code = 200
+                headers: ClassVar[dict[str, str]] = {}
+
                 def json(self):
                     return [{"name": "v1.0.0"}]
 
@@ -20,7 +34,7 @@ class TestGetGitHubLatestTag:
 
             return MockResponse()
 
-        monkeypatch.setattr("requests.get", mock_get)
+        monkeypatch.setattr("usethis._integrations.github.tags._SESSION.get", mock_get)
 
         assert get_github_latest_tag(owner="foo", repo="bar") == "v1.0.0"
 
@@ -33,7 +47,7 @@ class TestGetGitHubLatestTag:
 
             return MockResponse()
 
-        monkeypatch.setattr("requests.get", mock_get)
+        monkeypatch.setattr("usethis._integrations.github.tags._SESSION.get", mock_get)
 
         with pytest.raises(GitHubTagError, match="Failed to fetch tags"):
             get_github_latest_tag(owner="foo", repo="bar")
@@ -41,6 +55,9 @@ class TestGetGitHubLatestTag:
     def test_no_tags(self, monkeypatch: pytest.MonkeyPatch):
         def mock_get(*args, **kwargs):
             class MockResponse:
+                status_code = 200
+                headers: ClassVar[dict[str, str]] = {}
+
                 def json(self):
                     return []
 
@@ -49,7 +66,64 @@ class TestGetGitHubLatestTag:
 
             return MockResponse()
 
-        monkeypatch.setattr("requests.get", mock_get)
+        monkeypatch.setattr("usethis._integrations.github.tags._SESSION.get", mock_get)
 
         with pytest.raises(NoGitHubTagsFoundError):
             get_github_latest_tag(owner="foo", repo="bar")
+
+    def test_etag_cached(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        # Arrange
+        def mock_get(*args, **kwargs):
+            class MockResponse:
+                status_code = 200
+                headers: ClassVar[dict[str, str]] = {"ETag": '"abc"'}
+
+                def json(self):
+                    return [{"name": "v1.0.0"}]
+
+                def raise_for_status(self):
+                    pass
+
+            return MockResponse()
+
+        monkeypatch.setattr("usethis._integrations.github.tags._SESSION.get", mock_get)
+
+        # Act
+        get_github_latest_tag(owner="foo", repo="bar")
+
+        # Assert
+        entry = json.loads((tmp_path / "foo" / "bar.json").read_text())
+        assert entry["etag"] == '"abc"'
+        assert entry["tag"] == "v1.0.0"
+
+    def test_not_modified(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        # Arrange
+        (tmp_path / "foo").mkdir()
+        (tmp_path / "foo" / "bar.json").write_text(
+            json.dumps({"etag": '"abc"', "tag": "v0.9.0"})
+        )
+        sent_headers = {}
+
+        def mock_get(*args, headers, **kwargs):
+            sent_headers.update(headers)
+
+            class MockResponse:
+                status_code = 304
+                headers: ClassVar[dict[str, str]] = {}
+
+                def json(self):
+                    raise AssertionError
+
+                def raise_for_status(self):
+                    pass
+
+            return MockResponse()
+
+        monkeypatch.setattr("usethis._integrations.github.tags._SESSION.get", mock_get)
+
+        # Act
+        tag = get_github_latest_tag(owner="foo", repo="bar")
+
+        # Assert
+        assert tag == "v0.9.0"
+        assert sent_headers["If-None-Match"] == '"abc"'
@@ -8,6 +8,7 @@ from usethis._integrations.pre_commit.hooks import (
     add_placeholder_hook,
     add_repo,
     get_hook_names,
+    insert_repo,
     remove_hook,
 )
 from usethis._integrations.pre_commit.schema import (
@@ -112,6 +113,41 @@ repos:
         )
 
 
+class TestInsertRepo:
+    def test_predecessor_duplicated(self):
+        # Arrange
+        def local_repo(hook_id: str) -> LocalRepo:
+            return LocalRepo(
+                repo="local",
+                hooks=[
+                    HookDefinition(
+                        id=hook_id,
+                        name=hook_id,
+                        entry=hook_id,
+                        language=Language("python"),
+                    )
+                ],
+            )
+
+        existing_repos = [local_repo("bar"), local_repo("bar"), local_repo("baz")]
+        repo_to_insert = local_repo("new")
+
+        # Act
+        repos = insert_repo(
+            repo_to_insert=repo_to_insert,
+            existing_repos=list(existing_repos),
+            predecessor="bar",
+        )
+
+        # Assert
+        assert repos == [
+            existing_repos[0],
+            repo_to_insert,
+            existing_repos[1],
+            existing_repos[2],
+        ]
+
+
 class TestRemoveHook:
     def test_empty(self, tmp_path: Path):
         with change_cwd(tmp_path):
@@ -185,6 +221,48 @@ repos:
 """
         )
 
+    def test_consecutive_matches(self, tmp_path: Path):
+        (tmp_path / ".pre-commit-config.yaml").write_text(
+            """\
+repos:
+  - repo: local
+    hooks:
+      - id: bar
+        name: bar
+        entry: bar
+        language: python
+      - id: bar
+        name: bar
+        entry: bar
+        language: python
+  - repo: local
+    hooks:
+      - id: bar
+        name: bar
+        entry: bar
+        language: python
+  - repo: local
+    hooks:
+      - id: baz
+        name: baz
+        entry: baz
+        language: python
+"""
+        )
+        with change_cwd(tmp_path):
+            remove_hook("bar")
+        assert (tmp_path / ".pre-commit-config.yaml").read_text() == (
+            """\
+repos:
+  - repo: local
+    hooks:
+      - id: baz
+        name: baz
+        entry: baz
+        language: python
+"""
+        )
+
     def test_dont_delete_no_hook_repo(self, tmp_path: Path):
         (tmp_path / ".pre-commit-config.yaml").write_text(
             """\
@@ -4,7 +4,9 @@ import pytest
 
 from usethis._integrations.pre_commit.io import (
     PreCommitConfigYAMLConfigError,
+    batch_pre_commit_config_yaml_edits,
     edit_pre_commit_config_yaml,
+    read_pre_commit_config_yaml,
 )
 from usethis._test import change_cwd
 
@@ -46,3 +48,143 @@ repos:
             edit_pre_commit_config_yaml(),
         ):
             pass
+
+
+class TestBatchPreCommitConfigYAMLEdits:
+    def test_write_deferred_until_exit(self, tmp_path: Path):
+        # Arrange
+        path = tmp_path / ".pre-commit-config.yaml"
+        path.write_text("repos: []\n")
+
+        # Act
+        with change_cwd(tmp_path), batch_pre_commit_config_yaml_edits():
+            with edit_pre_commit_config_yaml() as doc:
+                doc.content["default_language_version"] = {"python": "python3.12"}
+
+            # Assert
+            assert path.read_text() == "repos: []\n"
+
+        assert "default_language_version" in path.read_text()
+
+    def test_edits_share_document(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / ".pre-commit-config.yaml").write_text("repos: []\n")
+
+        # Act
+        with change_cwd(tmp_path), batch_pre_commit_config_yaml_edits():
+            with edit_pre_commit_config_yaml() as doc1:
+                pass
+            with edit_pre_commit_config_yaml() as doc2:
+                pass
+
+        # Assert
+        assert doc1 is doc2
+
+    def test_invalid_edit_not_written(self, tmp_path: Path):
+        # Arrange
+        path = tmp_path / ".pre-commit-config.yaml"
+        path.write_text("repos: []\n")
+
+        # Act
+        with (
+            change_cwd(tmp_path),
+            pytest.raises(PreCommitConfigYAMLConfigError),
+            batch_pre_commit_config_yaml_edits(),
+            edit_pre_commit_config_yaml() as doc,
+        ):
+            del doc.content["repos"]
+
+        # Assert
+        assert path.read_text() == "repos: []\n"
+
+    def test_error_discards_edits(self, tmp_path: Path):
+        # Arrange
+        path = tmp_path / ".pre-commit-config.yaml"
+        path.write_text("repos: []\n")
+
+        def edit_then_fail():
+            with batch_pre_commit_config_yaml_edits():
+                with edit_pre_commit_config_yaml() as doc:
+                    del doc.content["repos"]
+                msg = "Something went wrong."
+                raise ValueError(msg)
+
+        # Act
+        with change_cwd(tmp_path), pytest.raises(ValueError, match="went wrong"):
+            edit_then_fail()
+
+        # Assert
+        assert path.read_text() == "repos: []\n"
+
+    def test_handled_error_keeps_earlier_edits(self, tmp_path: Path):
+        # Arrange
+        path = tmp_path / ".pre-commit-config.yaml"
+        path.write_text("repos: []\n")
+
+        def fail_within_edit():
+            with edit_pre_commit_config_yaml():
+                msg = "Something went wrong."
+                raise ValueError(msg)
+
+        # Act
+        with change_cwd(tmp_path), batch_pre_commit_config_yaml_edits():
+            with edit_pre_commit_config_yaml() as doc:
+                doc.content["default_language_version"] = {"python": "python3.12"}
+            with pytest.raises(ValueError, match="went wrong"):
+                fail_within_edit()
+            with edit_pre_commit_config_yaml() as doc:
+                doc.content["default_stages"] = ["pre-commit"]
+
+        # Assert
+        contents = path.read_text()
+        assert "default_language_version" in contents
+        assert "default_stages" in contents
+
+    def test_unused_does_not_create_file(self, tmp_path: Path):
+        # Act
+        with change_cwd(tmp_path), batch_pre_commit_config_yaml_edits():
+            pass
+
+        # Assert
+        assert not (tmp_path / ".pre-commit-config.yaml").exists()
+
+
+class TestReadPreCommitConfigYAML:
+    def test_unchanged_file_is_cached(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / ".pre-commit-config.yaml").write_text("repos: []\n")
+
+        # Act
+        with change_cwd(tmp_path):
+            model1 = read_pre_commit_config_yaml()
+            model2 = read_pre_commit_config_yaml()
+
+        # Assert
+        assert model1 is model2
+
+    def test_sees_edits(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / ".pre-commit-config.yaml").write_text("repos: []\n")
+
+        # Act
+        with change_cwd(tmp_path):
+            read_pre_commit_config_yaml()
+            with edit_pre_commit_config_yaml() as doc:
+                doc.content["default_language_version"] = {"python": "python3.12"}
+            model = read_pre_commit_config_yaml()
+
+        # Assert
+        assert model.default_language_version is not None
+
+    def test_sees_batched_edits(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / ".pre-commit-config.yaml").write_text("repos: []\n")
+
+        # Act
+        with change_cwd(tmp_path), batch_pre_commit_config_yaml_edits():
+            with edit_pre_commit_config_yaml() as doc:
+                pass
+            model = read_pre_commit_config_yaml()
+
+        # Assert
+        assert model is doc.model
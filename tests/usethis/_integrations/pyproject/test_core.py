@@ -9,9 +9,13 @@ from usethis._integrations.pyproject.core import (
     append_config_list,
     get_config_value,
     remove_config_value,
+    remove_from_config_list,
     set_config_value,
 )
-from usethis._integrations.pyproject.io import PyProjectTOMLNotFoundError
+from usethis._integrations.pyproject.io import (
+    PyProjectTOMLNotFoundError,
+    edit_pyproject_toml,
+)
 from usethis._test import change_cwd
 
 
@@ -49,6 +53,23 @@ key = "value"
         # Assert
         assert value == "value"
 
+    def test_sees_deferred_edits(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "pyproject.toml").write_text(
+            """\
+[tool.usethis]
+key = "value"
+"""
+        )
+
+        # Act
+        with change_cwd(tmp_path), edit_pyproject_toml():
+            set_config_value(["tool", "usethis", "key"], "new", exists_ok=True)
+            value = get_config_value(["tool", "usethis", "key"])
+
+        # Assert
+        assert value == "new"
+
 
 class TestSetConfigValue:
     def test_empty(self, tmp_path: Path):
@@ -241,3 +262,125 @@ key = ["value1"]
 key = ["value1", "value2"]
 """
         )
+
+    def test_existing_sibling_kept(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "pyproject.toml").write_text(
+            """\
+[tool.usethis]
+key1 = ["value1"]
+"""
+        )
+
+        # Act
+        with change_cwd(tmp_path):
+            append_config_list(["tool", "usethis", "key2"], ["value2"])
+
+        # Assert
+        assert (
+            (tmp_path / "pyproject.toml").read_text()
+            == """\
+[tool.usethis]
+key1 = ["value1"]
+key2 = ["value2"]
+"""
+        )
+
+    def test_multiline_kept(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "pyproject.toml").write_text(
+            """\
+[tool.usethis]
+key = [
+    "value1",
+]
+"""
+        )
+
+        # Act
+        with change_cwd(tmp_path):
+            append_config_list(["tool", "usethis", "key"], ["value2"])
+
+        # Assert
+        assert (
+            (tmp_path / "pyproject.toml").read_text()
+            == """\
+[tool.usethis]
+key = [
+    "value1",
+    "value2",
+]
+"""
+        )
+
+
+class TestRemoveFromConfigList:
+    def test_missing(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "pyproject.toml").write_text(
+            """\
+[tool.usethis]
+key1 = ["value1"]
+"""
+        )
+
+        # Act
+        with change_cwd(tmp_path):
+            remove_from_config_list(["tool", "usethis", "key2"], ["value1"])
+
+        # Assert
+        assert (
+            (tmp_path / "pyproject.toml").read_text()
+            == """\
+[tool.usethis]
+key1 = ["value1"]
+"""
+        )
+
+    def test_remove_some(self, tmp_path: Path):
+        # Arrange
+        (tmp_path / "pyproject.toml").write_text(
+            """\
+[tool.usethis]
+key = [
+    "value1",
+    "value2",
+    "value3",
+]
+"""
+        )
+
+        # Act
+        with change_cwd(tmp_path):
+            remove_from_config_list(
+                ["tool", "usethis", "key"], ["value1", "value3", "value4"]
+            )
+
+        # Assert
+        assert (
+            (tmp_path / "pyproject.toml").read_text()
+            == """\
+[tool.usethis]
+key = [
+    "value2",
+]
+"""
+        )
+
+    def test_no_match_not_rewritten(self, tmp_path: Path):
+        # Arrange
+        path = tmp_path / "pyproject.toml"
+        path.write_text(
+            """\
+[tool.usethis]
+key = ["value1"]
+"""
+        )
+        mtime = path.stat().st_mtime_ns
+
+        # Act
+        with change_cwd(tmp_path):
+            remove_from_config_list(["tool", "usethis", "key"], ["value2"])
+
+        # Assert
+        assert path.stat().st_mtime_ns == mtime
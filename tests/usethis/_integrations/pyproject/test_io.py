@@ -6,7 +6,13 @@ from usethis._integrations.pyproject.errors import (
     PyProjectTOMLDecodeError,
     PyProjectTOMLNotFoundError,
 )
-from usethis._integrations.pyproject.io import read_pyproject_dict
+from usethis._integrations.pyproject.io import (
+    edit_pyproject_toml,
+    flush_pyproject_toml,
+    read_pyproject_dict,
+    read_pyproject_toml,
+    write_pyproject_toml,
+)
 from usethis._test import change_cwd
 
 
@@ -48,3 +54,170 @@ class TestReadPyProjectDict:
         # Act, Assert
         with change_cwd(tmp_path), pytest.raises(PyProjectTOMLNotFoundError):
             read_pyproject_dict()
+
+
+class TestEditPyprojectTOML:
+    def test_write_deferred_until_exit(self, tmp_path: Path):
+        # Arrange
+        path = tmp_path / "pyproject.toml"
+        path.write_text('name = "usethis"\n')
+
+        # Act
+        with change_cwd(tmp_path), edit_pyproject_toml():
+            pyproject = read_pyproject_toml()
+            pyproject["version"] = "0.1.0"
+            write_pyproject_toml(pyproject)
+
+            # Assert
+            assert path.read_text() == 'name = "usethis"\n'
+
+        assert path.read_text() == 'name = "usethis"\nversion = "0.1.0"\n'
+
+    def test_reads_share_document(self, tmp_path: Path):
+        # Arrange
+        path = tmp_path / "pyproject.toml"
+        path.write_text('name = "usethis"\n')
+
+        # Act
+        with change_cwd(tmp_path), edit_pyproject_toml():
+            pyproject = read_pyproject_toml()
+            pyproject["version"] = "0.1.0"
+            write_pyproject_toml(pyproject)
+
+            # Assert
+            assert read_pyproject_toml() is pyproject
+            assert read_pyproject_dict() == {"name": "usethis", "version": "0.1.0"}
+
+    def test_nested(self, tmp_path: Path):
+        # Arrange
+        path = tmp_path / "pyproject.toml"
+        path.write_text('name = "usethis"\n')
+
+        # Act
+        with change_cwd(tmp_path), edit_pyproject_toml():
+            with edit_pyproject_toml():
+                pyproject = read_pyproject_toml()
+                pyproject["version"] = "0.1.0"
+                write_pyproject_toml(pyproject)
+
+            # Assert
+            assert path.read_text() == 'name = "usethis"\n'
+
+    def test_no_write_if_unchanged(self, tmp_path: Path):
+        # Arrange
+        path = tmp_path / "pyproject.toml"
+        path.write_text('name = "usethis"\n')
+        mtime = path.stat().st_mtime_ns
+
+        # Act
+        with change_cwd(tmp_path), edit_pyproject_toml():
+            read_pyproject_toml()
+
+        # Assert
+        assert path.stat().st_mtime_ns == mtime
+
+    def test_dict_reads_share_content(self, tmp_path: Path):
+        # Arrange
+        path = tmp_path / "pyproject.toml"
+        path.write_text('name = "usethis"\n')
+
+        # Act
+        with change_cwd(tmp_path), edit_pyproject_toml():
+            content = read_pyproject_dict()
+            pyproject = read_pyproject_toml()
+            pyproject["version"] = "0.1.0"
+            write_pyproject_toml(pyproject)
+
+            # Assert
+            assert read_pyproject_dict() is not content
+            assert read_pyproject_dict() is read_pyproject_dict()
+            assert read_pyproject_dict() == {"name": "usethis", "version": "0.1.0"}
+
+    def test_flush_keep_document(self, tmp_path: Path):
+        # Arrange
+        path = tmp_path / "pyproject.toml"
+        path.write_text('name = "usethis"\n')
+
+        # Act
+        with change_cwd(tmp_path), edit_pyproject_toml():
+            pyproject = read_pyproject_toml()
+            pyproject["version"] = "0.1.0"
+            write_pyproject_toml(pyproject)
+            flush_pyproject_toml(keep_document=True)
+
+            # Assert
+            assert path.read_text() == 'name = "usethis"\nversion = "0.1.0"\n'
+            assert read_pyproject_toml() is pyproject
+
+    def test_error_discards_changes(self, tmp_path: Path):
+        # Arrange
+        path = tmp_path / "pyproject.toml"
+        path.write_text('name = "usethis"\n')
+
+        def edit_then_fail():
+            with edit_pyproject_toml():
+                pyproject = read_pyproject_toml()
+                pyproject["version"] = "0.1.0"
+                write_pyproject_toml(pyproject)
+                msg = "Something went wrong."
+                raise ValueError(msg)
+
+        # Act
+        with change_cwd(tmp_path), pytest.raises(ValueError, match="went wrong"):
+            edit_then_fail()
+
+        # Assert
+        assert path.read_text() == 'name = "usethis"\n'
+        with change_cwd(tmp_path), edit_pyproject_toml():
+            assert read_pyproject_toml() == {"name": "usethis"}
+
+    def test_nested_error_handled(self, tmp_path: Path):
+        # Arrange
+        path = tmp_path / "pyproject.toml"
+        path.write_text('name = "usethis"\n')
+
+        def fail_within_edit():
+            with edit_pyproject_toml():
+                msg = "Something went wrong."
+                raise ValueError(msg)
+
+        # Act
+        with change_cwd(tmp_path), edit_pyproject_toml():
+            pyproject = read_pyproject_toml()
+            pyproject["version"] = "0.1.0"
+            write_pyproject_toml(pyproject)
+            with pytest.raises(ValueError, match="went wrong"):
+                fail_within_edit()
+            pyproject = read_pyproject_toml()
+            pyproject["description"] = "Automate Python package tasks."
+            write_pyproject_toml(pyproject)
+
+        # Assert
+        assert path.read_text() == (
+            'name = "usethis"\n'
+            'version = "0.1.0"\n'
+            'description = "Automate Python package tasks."\n'
+        )
+
+    def test_failed_flush_forgets_document(self, tmp_path: Path):
+        # Arrange
+        path = tmp_path / "pyproject.toml"
+        path.write_text('name = "usethis"\n')
+
+        with change_cwd(tmp_path), edit_pyproject_toml():
+            pyproject = read_pyproject_toml()
+            pyproject["version"] = "0.1.0"
+            write_pyproject_toml(pyproject)
+            path.unlink()
+            path.mkdir()
+            with pytest.raises(IsADirectoryError):
+                flush_pyproject_toml()
+            path.rmdir()
+            path.write_text('name = "other"\n')
+
+            # Act
+            pyproject = read_pyproject_toml()
+
+        # Assert
+        assert pyproject == {"name": "other"}
+        assert path.read_text() == 'name = "other"\n'
@@ -80,6 +80,20 @@ class TestAddDepsToGroup:
             # Assert
             assert "pytest" in get_deps_from_group("test")
 
+    @pytest.mark.usefixtures("_vary_network_conn")
+    def test_multiple_deps(self, uv_init_dir: Path, capfd: pytest.CaptureFixture[str]):
+        with change_cwd(uv_init_dir):
+            # Act
+            add_deps_to_group(["pytest", "pytest-cov"], "test")
+
+            # Assert
+            assert set(get_deps_from_group("test")) == {"pytest", "pytest-cov"}
+            out, _ = capfd.readouterr()
+            assert out == (
+                "✔ Adding 'pytest' to the 'test' dependency group.\n"
+                "✔ Adding 'pytest-cov' to the 'test' dependency group.\n"
+            )
+
 
 class TestRemoveDepsFromGroup:
     @pytest.mark.usefixtures("_vary_network_conn")
@@ -94,6 +108,18 @@ class TestRemoveDepsFromGroup:
             # Assert
             assert "pytest" not in get_deps_from_group("test")
 
+    @pytest.mark.usefixtures("_vary_network_conn")
+    def test_multiple_deps(self, uv_init_dir: Path):
+        with change_cwd(uv_init_dir):
+            # Arrange
+            add_deps_to_group(["pytest", "pytest-cov"], "test")
+
+            # Act
+            remove_deps_from_group(["pytest", "pytest-cov"], "test")
+
+            # Assert
+            assert get_deps_from_group("test") == []
+
 
 class TestIsDepInAnyGroup:
     def test_no_group(self, uv_init_dir: Path):
@@ -25,7 +25,7 @@ from ruamel.yaml.scalarstring import (
 from ruamel.yaml.timestamp import TimeStamp
 
 from usethis._integrations.yaml.errors import InvalidYAMLError
-from usethis._integrations.yaml.io import edit_yaml
+from usethis._integrations.yaml.io import edit_yaml, parse_yaml
 from usethis._test import change_cwd
 
 
@@ -395,6 +395,20 @@ x:
 """
         )
 
+    def test_no_write(self, tmp_path: Path):
+        # Arrange
+        path = tmp_path / "x.yml"
+        path.write_text("hello:    world\n")
+
+        # Act
+        with edit_yaml(path) as doc:
+            assert isinstance(doc.content, dict)  # Help pyright
+            doc.content["hello"] = "there"
+            doc.write = False
+
+        # Assert
+        assert path.read_text() == "hello:    world\n"
+
     def test_invalid_indentation(self, tmp_path: Path):
         # Arrange
         (tmp_path / "x.yml").write_text(
@@ -413,3 +427,34 @@ repos:
             edit_yaml(tmp_path / "x.yml") as _,
         ):
             pass
+
+
+class TestParseYaml:
+    def test_plain_types(self, tmp_path: Path):
+        # Act
+        content = parse_yaml(
+            """\
+hello: # comment
+  - world
+  - 1
+""",
+            yaml_path=tmp_path / "x.yml",
+        )
+
+        # Assert
+        assert content == {"hello": ["world", 1]}
+        assert type(content) is dict
+        assert type(content["hello"]) is list
+
+    def test_invalid_indentation(self, tmp_path: Path):
+        # Act, Assert
+        with pytest.raises(InvalidYAMLError):
+            parse_yaml(
+                """\
+repos:
+  - repo: local
+        hooks:
+          - id: placeholder
+""",
+                yaml_path=tmp_path / "x.yml",
+            )
@@ -5,8 +5,9 @@ from usethis._pipeweld.func import (
     Adder,
     Partition,
     _flatten_partition,
-    _op_series_merge_partitions,
     _parallel_merge_partitions,
+    _series_merge_partitions,
+    get_endpoint,
 )
 from usethis._pipeweld.ops import InsertParallel, InsertSuccessor
 from usethis._pipeweld.result import WeldResult
@@ -412,7 +413,7 @@ class TestFlattenPartition:
             _flatten_partition(partition)
 
 
-class TestOpSeriesMergePartitions:
+class TestSeriesMergePartitions:
     def test_rhs_prerequisite_lhs_no_prerequisite(self):
         # Arrange
         partition1 = Partition(
@@ -429,7 +430,7 @@ class TestOpSeriesMergePartitions:
         )
 
         # Act
-        partition = _op_series_merge_partitions(partition1, partition2)
+        partition = _series_merge_partitions([partition1, partition2])
 
         # Assert
         assert partition == Partition(
@@ -455,7 +456,7 @@ class TestOpSeriesMergePartitions:
         )
 
         # Act
-        partition = _op_series_merge_partitions(partition1, partition2)
+        partition = _series_merge_partitions([partition1, partition2])
 
         # Assert
         assert partition == Partition(
@@ -481,7 +482,7 @@ class TestOpSeriesMergePartitions:
         )
 
         # Act
-        partition = _op_series_merge_partitions(partition1, partition2)
+        partition = _series_merge_partitions([partition1, partition2])
 
         # Assert
         assert partition == Partition(
@@ -507,7 +508,7 @@ class TestOpSeriesMergePartitions:
         )
 
         # Act
-        partition = _op_series_merge_partitions(partition1, partition2)
+        partition = _series_merge_partitions([partition1, partition2])
 
         # Assert
         assert partition == Partition(
@@ -533,7 +534,7 @@ class TestOpSeriesMergePartitions:
         )
 
         # Act
-        partition = _op_series_merge_partitions(partition1, partition2)
+        partition = _series_merge_partitions([partition1, partition2])
 
         # Assert
         assert partition == Partition(
@@ -559,7 +560,7 @@ class TestOpSeriesMergePartitions:
         )
 
         # Act
-        partition = _op_series_merge_partitions(partition1, partition2)
+        partition = _series_merge_partitions([partition1, partition2])
 
         # Assert
         assert partition == Partition(
@@ -585,7 +586,7 @@ class TestOpSeriesMergePartitions:
         )
 
         # Act
-        partition = _op_series_merge_partitions(partition1, partition2)
+        partition = _series_merge_partitions([partition1, partition2])
 
         # Assert
         assert partition == Partition(
@@ -613,7 +614,7 @@ class TestOpSeriesMergePartitions:
         )
 
         # Act
-        partition = _op_series_merge_partitions(partition1, partition2)
+        partition = _series_merge_partitions([partition1, partition2])
 
         # Assert
         assert partition == Partition(
@@ -641,7 +642,7 @@ class TestOpSeriesMergePartitions:
         )
 
         # Act
-        partition = _op_series_merge_partitions(partition1, partition2)
+        partition = _series_merge_partitions([partition1, partition2])
 
         # Assert
         assert partition == Partition(
@@ -650,3 +651,45 @@ class TestOpSeriesMergePartitions:
             postrequisite_component="B",
             top_ranked_endpoint="B",
         )
+
+    def test_prerequisite_after_nondependent(self):
+        # Arrange
+        partitions = [
+            Partition(prerequisite_component="A", top_ranked_endpoint="A"),
+            Partition(nondependent_component="B", top_ranked_endpoint="B"),
+            Partition(prerequisite_component="C", top_ranked_endpoint="C"),
+            Partition(postrequisite_component="D", top_ranked_endpoint="D"),
+            Partition(nondependent_component="E", top_ranked_endpoint="E"),
+        ]
+
+        # Act
+        partition = _series_merge_partitions(partitions)
+
+        # Assert
+        assert partition == Partition(
+            prerequisite_component=series("A", "B", "C"),
+            nondependent_component=None,
+            postrequisite_component=series("D", "E"),
+            top_ranked_endpoint="E",
+        )
+
+
+class TestGetEndpoint:
+    def test_series_last(self):
+        # Act
+        endpoint = get_endpoint(series("B", "A", series()))
+
+        # Assert
+        assert endpoint == "A"
+
+    def test_parallel_alphabetical(self):
+        # Act
+        endpoint = get_endpoint(parallel("C", series("D", "B"), "E"))
+
+        # Assert
+        assert endpoint == "B"
+
+    def test_parallel_empty(self):
+        # Act, Assert
+        with pytest.raises(ValueError, match="no steps"):
+            get_endpoint(parallel(series()))
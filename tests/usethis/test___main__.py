@@ -0,0 +1,35 @@
+import pytest
+
+from usethis._subprocess import SubprocessFailedError, call_subprocess
+
+
+class TestHelp:
+    def test_command_order(self):
+        # Act
+        output = call_subprocess(["usethis", "--help"])
+
+        # Assert
+        names = ["readme", "version", "badge", "browse", "ci", "show", "tool"]
+        positions = [output.index(f" {name} ") for name in names]
+        assert positions == sorted(positions)
+
+
+class TestLazySubcommands:
+    def test_tool(self):
+        # Act
+        output = call_subprocess(["usethis", "tool", "--help"])
+
+        # Assert
+        assert "pyproject-fmt" in output
+
+    def test_ci(self):
+        # Act
+        output = call_subprocess(["usethis", "ci", "bitbucket", "--help"])
+
+        # Assert
+        assert "Use Bitbucket pipelines for CI." in output
+
+    def test_unknown(self):
+        # Act, Assert
+        with pytest.raises(SubprocessFailedError):
+            call_subprocess(["usethis", "does-not-exist"])
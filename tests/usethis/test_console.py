@@ -1,5 +1,6 @@
 import pytest
 
+from usethis._config import usethis_config
 from usethis._console import box_print, err_print, info_print, tick_print
 
 
@@ -41,3 +42,17 @@ class TestErrPrint:
         # Assert
         out, _ = capfd.readouterr()
         assert out == "✗ Hello\n"
+
+
+class TestQuiet:
+    def test_no_output(self, capfd: pytest.CaptureFixture[str]) -> None:
+        # Act
+        with usethis_config.set(quiet=True):
+            tick_print("Hello")
+            box_print("Hello")
+            info_print("Hello")
+            err_print("Hello")
+
+        # Assert
+        out, _ = capfd.readouterr()
+        assert out == ""